@@ -1,13 +1,21 @@
+import logging
+
 import simpy
 
+from PowerConsumer import PowerConsumer
+
+log = logging.getLogger("isru")
+
 # -------------------------------------------------
 # Communication Module
 # -------------------------------------------------
 
-class CommunicationModule:
+class CommunicationModule(PowerConsumer):
     """
     Communication module with constant and spike power consumption.
     """
+    __slots__ = ('system', 'name', 'constantPowerRate', 'totalEnergyConsumed', 'pendingSpikeEnergy')
+
     def __init__(self, system, name, attributeDict):
         """
         Args:
@@ -19,33 +27,31 @@ class CommunicationModule:
         self.name = name
         self.constantPowerRate = attributeDict["constantPowerRate"]  # kW
         self.totalEnergyConsumed = attributeDict["totalEnergyConsumed"]  # kWh
-        self.spikeEvents = []  # List of (time, energy) tuples
-        
+        self.pendingSpikeEnergy = 0.0  # kWh delivered by spike processes, drained each tick
+
     def setConstantPowerRate(self, rate):
         """Change the constant power consumption rate"""
         self.constantPowerRate = rate
-        
+
     def scheduleSpike(self, time, energy):
         """Schedule a one-time power spike event"""
-        self.spikeEvents.append((time, energy))
-        
+        self.system.process(self._spike(time, energy))
+
+    def _spike(self, time, energy):
+        """SimPy process that deposits spike energy when its time arrives"""
+        yield self.system.timeout(time - self.system.now)
+        self.pendingSpikeEnergy += energy
+        # %-style args are only formatted if a handler is enabled
+        log.debug("[%.2f hr] %s: Power spike of %.2f kWh", self.system.now, self.name, energy)
+
     def getCurrentPowerDemand(self, dt):
         """Calculate current power demand for time period dt (hours)"""
         demand = self.constantPowerRate * dt
-        
-        # Check for spike events in current time window
-        currentTime = self.system.now
-        spikesToRemove = []
-        for i, (spikeTime, spikeEnergy) in enumerate(self.spikeEvents):
-            if abs(currentTime - spikeTime) < dt/2:  # Spike occurs in this timestep
-                demand += spikeEnergy
-                spikesToRemove.append(i)
-                print(f"[{currentTime:.2f} hr] {self.name}: Power spike of {spikeEnergy:.2f} kWh")
-        
-        # Remove processed spikes
-        for i in reversed(spikesToRemove):
-            self.spikeEvents.pop(i)
-        
+
+        # Spikes are delivered event-driven by _spike; just drain the pending energy
+        demand += self.pendingSpikeEnergy
+        self.pendingSpikeEnergy = 0.0
+
         self.totalEnergyConsumed += demand
         return demand
 
@@ -54,7 +60,7 @@ class CommunicationModule:
             "Name": self.name,
             "Energy_Consumed_kWh": round(self.totalEnergyConsumed, 2),
             "Constant_Power_Rate": round(self.constantPowerRate, 2),
-            "Spike_Events_Array": self.spikeEvents
+            "Pending_Spike_Energy_kWh": self.pendingSpikeEnergy
         }
         return attr
         
@@ -0,0 +1,82 @@
+import numpy as np
+
+from numba_kernels import simulateBattery
+
+# -------------------------------------------------
+# Vectorized Fast-Path Simulation
+# -------------------------------------------------
+
+class FastSim:
+    """
+    Vectorized fixed-dt fast path for the power-balance simulation.
+
+    Replays the same arithmetic as PowerManager.managePower on NumPy
+    arrays: constant-rate consumer demand becomes a (consumers, ticks)
+    matrix, scheduled spikes are scattered into it, and only the battery
+    charge/discharge recurrence stays a sequential loop. Use this when
+    consumers are constant-rate plus pre-scheduled spikes and nothing
+    needs to react mid-simulation; the SimPy model remains the flexible
+    path for everything else.
+    """
+    def __init__(self, solarPowerOutput, batteryCapacity, batteryCharge, consumerRates, spikeEvents=None):
+        """
+        Args:
+            solarPowerOutput: Current solar power output (kW)
+            batteryCapacity: Battery capacity (kWh)
+            batteryCharge: Initial battery charge (kWh)
+            consumerRates: Constant power rate per consumer (kW)
+            spikeEvents: List of (consumerIndex, time, energy) spikes
+        """
+        self.solarPowerOutput = solarPowerOutput
+        self.batteryCapacity = batteryCapacity
+        self.batteryCharge = batteryCharge
+        self.consumerRates = np.asarray(consumerRates, dtype=np.float64)
+        self.spikeEvents = list(spikeEvents) if spikeEvents else []
+
+    def runVectorized(self, duration, dt=1.0):
+        """
+        Run the power balance for the given duration (hours).
+
+        Returns a dict with per-tick arrays (times, powerGenerated,
+        totalDemand, batteryCharge) plus final battery state.
+        Raises RuntimeError on a power failure, same as the SimPy model.
+        """
+        # managePower ticks after each timeout(dt), so ticks land at dt, 2*dt, ... < duration
+        times = np.arange(dt, duration, dt)
+        numTicks = times.size
+
+        # Constant-rate demand matrix: (consumers, ticks)
+        demand = np.outer(self.consumerRates, np.ones(numTicks)) * dt
+
+        # Scatter spikes onto the first tick at or after their scheduled time
+        for consumerIndex, spikeTime, spikeEnergy in self.spikeEvents:
+            tickIndex = np.searchsorted(times, spikeTime)
+            if tickIndex < numTicks:
+                np.add.at(demand[consumerIndex], tickIndex, spikeEnergy)
+
+        energyGenerated = np.full(numTicks, self.solarPowerOutput * dt)
+        totalDemand = demand.sum(axis=0)
+
+        # Battery recurrence is inherently sequential; run it in the
+        # compiled kernel (plain Python when numba is unavailable)
+        batterySeries = np.empty(numTicks)
+        failIndex, charge, totalFromBattery = simulateBattery(
+            energyGenerated, totalDemand, self.batteryCapacity, self.batteryCharge, batterySeries
+        )
+        if failIndex >= 0:
+            needed = totalDemand[failIndex] - energyGenerated[failIndex]
+            raise RuntimeError(
+                f"[{times[failIndex]:.2f} hr] POWER FAILURE: Insufficient power! "
+                f"Needed {needed:.2f} kWh, but only {charge:.2f} kWh available. "
+                f"Deficit: {needed - charge:.2f} kWh. Battery depleted."
+            )
+
+        self.batteryCharge = charge
+
+        return {
+            "times": times,
+            "powerGenerated": energyGenerated,
+            "totalDemand": totalDemand,
+            "batteryCharge": batterySeries,
+            "finalBatteryCharge": charge,
+        }
@@ -15,6 +15,8 @@ References:
 [1] https://doi.org/10.1073/pnas.2306146122 
 """
 
+import logging
+
 import simpy
 from ISRUPlant import ISRUPlant
 from SolarPowerSystem import SolarPowerSystem
@@ -29,6 +31,8 @@ from LoggingManager import LoggingManager
 import json
 import time
 
+log = logging.getLogger("isru")
+
 
 # -------------------------------------------------
 # Rover Process (Modified to work with new rover system)
@@ -38,7 +42,7 @@ def rover(system, regolithBuffer, batchSize, travelTime):
     while True:
         yield system.timeout(travelTime)
         yield regolithBuffer.put(batchSize)
-        print(f"[{system.now:.2f} hr] Rover delivered {batchSize} kg regolith")
+        log.debug("[%.2f hr] Rover delivered %s kg regolith", system.now, batchSize)
 
 def regolithRoverController(system, regolithBuffer, batchSize, distance, rover: LunarRover):
     """Continuously delivers regolith to the plant"""
@@ -47,7 +51,7 @@ def regolithRoverController(system, regolithBuffer, batchSize, distance, rover:
         yield system.process(rover.travel(distance))
         rover.unloadCargo()
         yield regolithBuffer.put(batchSize)
-        print(f"[{system.now:.2f} hr] Rover delivered {batchSize} kg regolith")
+        log.debug("[%.2f hr] Rover delivered %s kg regolith", system.now, batchSize)
 
 # -------------------------------------------------
 # Plant Controller
@@ -59,27 +63,15 @@ def plantController(system, plant, regolithBuffer, batchSize):
         yield system.process(plant.processRegolith(system, batchSize))
 
 
-# -------------------------------------------------
-# LOX Storage Energy
-# -------------------------------------------------
-def LOXStorageEnergy(system, plant, dt=1.0):
-    """
-    Continuously accounts for LOX storage energy.
-    dt = accounting time step (hours)
-    """
-    while True:
-        yield system.timeout(dt)
-
-        storageEnergy = 0.31 * plant.LOXStored * dt
-        plant.totalEnergyConsumed += storageEnergy
-
 def LOXDeliveryController(system, plant:ISRUPlant, rover: LunarRover, landingZone:LandingLaunchZone, distance, transportThreshold):
     while True:
         yield system.timeout(1)
         if plant.LOXStored > transportThreshold:
             LOXToTransport = plant.LOXStored #kg
+            plant._flushLoxEnergy()
             plant.LOXStored = 0
-            print(f"[{system.now:.2f} hr] Just emptied LOX stores at the ISRU plant. The following value should read 0: {plant.LOXStored}")
+            log.debug("[%.2f hr] Just emptied LOX stores at the ISRU plant. The following value should read 0: %s",
+                      system.now, plant.LOXStored)
             #Tell rover to load LOX stored
             rover.loadCargo(LOXToTransport)
             #Tell rover to travel roundtrip distance
@@ -89,13 +81,17 @@ def LOXDeliveryController(system, plant:ISRUPlant, rover: LunarRover, landingZon
             #Have Landing Zone recieve the LOX
             landingZone.receiveLOX(LOXToTransport)
             #print("Transported " + str(LOXToTransport) + " kg of LOX to " + landingZone.name + " which now has " + str(landingZone.loxStored) + " kg of LOX")
-            print(f"[{system.now:.2f} hr] Transported {LOXToTransport} kg of LOX to {landingZone.name} which now has {landingZone.loxStored} kg of LOX")
+            log.debug("[%.2f hr] Transported %s kg of LOX to %s which now has %s kg of LOX",
+                      system.now, LOXToTransport, landingZone.name, landingZone.loxStored)
             #print("The ISRU plant now has " + str(plant.LOXStored) + "kg of LOX stored.")
 
 # -------------------------------------------------
 # Example Usage in Main
 # -------------------------------------------------
-def main():
+def main(verbose=False):
+    # Per-event traces are DEBUG-level; keep them off the hot path by default
+    logging.basicConfig(level=logging.DEBUG if verbose else logging.WARNING)
+
     start_time = time.perf_counter()
     # Experiment data -----------------------------------------
     experiment = "ISRU Processing Plant with Full Infrastructure"
@@ -167,7 +163,6 @@ def main():
     # Start processes
     system.process(regolithRoverController(system, regolithBuffer, roverBatch, 1, regolithCargoRover))
     system.process(plantController(system, plant, regolithBuffer, roverBatch))
-    system.process(LOXStorageEnergy(system, plant, dt=1.0))
     system.process(LOXDeliveryController(system, plant, LOXCargoRover, landingZone, distance=1, transportThreshold=100))
     system.process(powerManager.managePower(dt=1.0))  # NEW: Power management
 
@@ -177,6 +172,9 @@ def main():
     print("="*70)
     system.run(until=simDuration)
 
+    # Account storage energy accrued since the last LOX-level change
+    plant._flushLoxEnergy()
+
     # Analysis ------------------------------------------------
     print("\n" + "="*70)
     print("SIMULATION RESULTS")
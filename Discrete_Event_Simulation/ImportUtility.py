@@ -1,3 +1,4 @@
+import functools
 import sys
 from pathlib import Path
 import json
@@ -47,6 +48,11 @@ def generate_json_from_sysml(sysml_filename, json_filename):
 
     return vetted_parts
 
+@functools.lru_cache(maxsize=None)
+def _vetted_parts(json_path, mtime):
+    """Run vetting once per (path, mtime); mtime busts the cache on file edits."""
+    return VettingProc(source=json_path).by_name
+
 #NOTE: JSON File must be conatined under database/json/ and the json_filename must only be the name of the json file (i.e. "ISRU.json")
 def data_from_json(json_filename):
     ROOT = Path.cwd().parent
@@ -55,9 +61,10 @@ def data_from_json(json_filename):
     DATA_JSON  = ROOT / "database" / "json"
     JSON_FILE  = DATA_JSON  / json_filename
 
-    vetting = VettingProc(source=str(JSON_FILE))
-    vetted_parts = vetting.by_name
-    
+    # Cache the parse + vetting; repeated imports of the same JSON are free
+    json_path = str(JSON_FILE)
+    vetted_parts = _vetted_parts(json_path, os.stat(json_path).st_mtime)
+
     #print(list(vetted_parts.keys()))
     #print(vetted_parts['ISRUPlant'])
 
@@ -1,5 +1,9 @@
+import logging
+
 import simpy
 
+log = logging.getLogger("isru")
+
 # -------------------------------------------------
 # Lunar Rover (Requirement 5)
 # -------------------------------------------------
@@ -8,6 +12,10 @@ class LunarRover:
     """
     Lunar rover with cargo/crew capacity and energy consumption.
     """
+    __slots__ = ('system', 'name', 'type', 'maxCapacity', 'currentLoad', 'energyPerKmPerKg',
+                 'batteryCapacity', 'batteryCharge', 'totalDistanceTraveled',
+                 'totalEnergyConsumed', 'hoursPerKm')
+
     def __init__(self, system, name, roverType, attributeDict):
         """
         Args:
@@ -47,10 +55,10 @@ class LunarRover:
         self.batteryCharge -= energyNeeded
         self.totalDistanceTraveled += distance
         self.totalEnergyConsumed += energyNeeded
-        print("The total energy consumed by " + self.name + " is " + str(self.totalEnergyConsumed) + " kWh.")
+        log.debug("The total energy consumed by %s is %s kWh.", self.name, self.totalEnergyConsumed)
         yield self.system.timeout(distance*self.hoursPerKm)
         return energyNeeded
-    
+
     def loadCargo(self, mass):
         """Load cargo onto rover"""
         if self.currentLoad + mass > self.maxCapacity:
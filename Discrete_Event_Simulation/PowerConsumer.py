@@ -0,0 +1,21 @@
+# -------------------------------------------------
+# Power Consumer base class
+# -------------------------------------------------
+class PowerConsumer:
+    """
+    Base class for anything the PowerManager can draw demand from.
+    Guarantees getCurrentPowerDemand exists, so registration does not
+    need a per-consumer hasattr probe.
+    """
+    # No __dict__: subclasses keep their own __slots__ layouts intact
+    __slots__ = ()
+
+    # Subclasses whose demand is exactly constantPowerRate * dt every tick
+    # (no spikes, no state, no per-tick accounting) may set this True; the
+    # PowerManager then folds their rate into one cached sum instead of
+    # calling them each tick.
+    constantDemandOnly = False
+
+    def getCurrentPowerDemand(self, dt):
+        """Energy demanded over the time period dt (hours). Default: none."""
+        return 0.0
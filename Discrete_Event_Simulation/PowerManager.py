@@ -1,5 +1,11 @@
+import logging
+
 import simpy
 
+from PowerConsumer import PowerConsumer
+
+log = logging.getLogger("isru")
+
 # -------------------------------------------------
 # Power Manager (handles distribution)
 # -------------------------------------------------
@@ -8,10 +14,17 @@ class PowerManager:
     Manages power distribution from power system to all consumers.
     Tracks all power demands and manages battery charging/discharging.
     """
+    __slots__ = ('system', 'solarSystem', 'consumers', '_demandFns', '_constRatesSum',
+                 '_tick', 'powerGeneratedSeries', 'totalDemandSeries',
+                 'latestEnergyDemand', 'latestEnergyProduction')
+
     def __init__(self, system, solarSystem):
         self.system = system
         self.solarSystem = solarSystem
         self.consumers = []  # List of power consumers
+        self._demandFns = []  # Bound getCurrentPowerDemand methods of dynamic consumers
+        self._constRatesSum = 0.0  # Folded rates of constantDemandOnly consumers
+        self._tick = None  # Specialized total-demand function built by freeze()
         self.powerGeneratedSeries = [] #Create an array to track how much power is generated at each time step
         self.totalDemandSeries = [] #Create an array to track how much power demand exists at each time step
         
@@ -22,24 +35,54 @@ class PowerManager:
 
     def registerConsumer(self, consumer):
         """Register a power consumer"""
+        # The PowerConsumer protocol guarantees getCurrentPowerDemand,
+        # so no hasattr probe is needed here or per tick
+        assert isinstance(consumer, PowerConsumer), \
+            f"{consumer!r} is not a PowerConsumer"
         self.consumers.append(consumer)
-        
+        if consumer.constantDemandOnly:
+            # Pure constant-rate consumers are reduced to one cached sum;
+            # only dynamic consumers are called per tick
+            self._constRatesSum += consumer.constantPowerRate
+        else:
+            self._demandFns.append(consumer.getCurrentPowerDemand)
+        self._tick = None  # Consumer set changed; next managePower re-freezes
+
+    def freeze(self, dt):
+        """
+        Compile a total-demand function specialized for the registered
+        consumers and a fixed dt. The constant-rate sum is folded to a
+        literal and the dynamic calls are unrolled, so the per-tick cost
+        is one function call with no loop or repeated multiply.
+        """
+        names = [f"fn{i}" for i in range(len(self._demandFns))]
+        ns = dict(zip(names, self._demandFns))
+        terms = [repr(self._constRatesSum * dt)]
+        terms += [f"{name}({dt!r})" for name in names]
+        src = "def tick():\n    return " + " + ".join(terms) + "\n"
+        exec(compile(src, "<PowerManager.freeze>", "exec"), ns)
+        self._tick = ns['tick']
+
+
     def managePower(self, dt=1.0):
         """
         Continuously manage power generation and distribution.
         dt = time step (hours)
         """
+        # Specialize the demand reduction for this consumer set and dt
+        self.freeze(dt)
         while True:
             yield self.system.timeout(dt)
-            
+
             # Generate power from solar panels
             energyGenerated = self.solarSystem.generatePower(dt)
-            
-            # Calculate total demand
-            totalDemand = 0
-            for consumer in self.consumers:
-                if hasattr(consumer, 'getCurrentPowerDemand'):
-                    totalDemand += consumer.getCurrentPowerDemand(dt)
+
+            # Total demand via the frozen tick function (constant term
+            # folded in, dynamic calls unrolled); re-freeze if a consumer
+            # was registered mid-run
+            if self._tick is None:
+                self.freeze(dt)
+            totalDemand = self._tick()
             
             # Manage power balance
             energyBalance = energyGenerated - totalDemand
@@ -52,20 +95,16 @@ class PowerManager:
             self.powerGeneratedSeries.append(energyGenerated)
             self.totalDemandSeries.append(totalDemand)
 
-            if energyBalance > 0:
-                # Excess power - charge battery
-                stored = self.solarSystem.chargeBattery(energyBalance)
-                if stored < energyBalance:
-                    wasted = energyBalance - stored
-                    # print(f"[{self.system.now:.2f} hr] Wasted {wasted:.2f} kWh (battery full)")
-            elif energyBalance < 0:
-                # Deficit - discharge battery
-                needed = abs(energyBalance)
-                try:
-                    self.solarSystem.dischargeBattery(needed)
-                except RuntimeError as e:
-                    print(str(e))
-                    raise
+            # Single branchless battery update covers both charge and discharge
+            stored, discharged, deficit = self.solarSystem.updateBattery(energyBalance)
+            if deficit > 0:
+                message = (
+                    f"[{self.system.now:.2f} hr] POWER FAILURE: Insufficient power! "
+                    f"Needed {discharged + deficit:.2f} kWh, but only {discharged:.2f} kWh available. "
+                    f"Deficit: {deficit:.2f} kWh. Battery depleted."
+                )
+                log.error(message)
+                raise RuntimeError(message)
 
     def getLoggingAttributes(self):
         attr = {
@@ -1,12 +1,22 @@
+import logging
+
 import simpy
 
+from PowerConsumer import PowerConsumer
+
+log = logging.getLogger("isru")
+
 # -------------------------------------------------
 # Rover Charging Station
 # -------------------------------------------------
-class RoverChargingStation:
+class RoverChargingStation(PowerConsumer):
     """
     Charging station for lunar rovers with configurable efficiency.
     """
+    __slots__ = ('system', 'name', 'chargingPowerRate', 'efficiencyFactor',
+                 'totalEnergyConsumed', 'totalEnergyDelivered', 'resource',
+                 '_busy', '_cachedDt', '_demandIfBusy')
+
     def __init__(self, system, name, chargingPowerRate, efficiencyFactor=0.9):
         """
         Args:
@@ -22,7 +32,10 @@ class RoverChargingStation:
         self.totalEnergyConsumed = 0
         self.totalEnergyDelivered = 0
         self.resource = simpy.Resource(system, capacity=1)  # One rover at a time per station
-        
+        self._busy = False  # Tracked by chargeRover so the tick path skips resource introspection
+        self._cachedDt = None
+        self._demandIfBusy = 0.0
+
     def chargeRover(self, rover):
         """
         Charge a rover to full capacity.
@@ -30,31 +43,36 @@ class RoverChargingStation:
         """
         with self.resource.request() as req:
             yield req
-            
-            energyNeeded = rover.batteryCapacity - rover.batteryCharge
-            energyDelivered = energyNeeded
-            energyConsumed = energyNeeded / self.efficiencyFactor  # Account for losses
-            
-            chargingTime = energyConsumed / self.chargingPowerRate  # hours
-            
-            print(f"[{self.system.now:.2f} hr] {self.name}: Charging {rover.name} "
-                  f"({energyNeeded:.2f} kWh needed, {chargingTime:.2f} hr)")
-            
-            yield self.system.timeout(chargingTime)
-            
-            rover.batteryCharge = rover.batteryCapacity
-            self.totalEnergyConsumed += energyConsumed
-            self.totalEnergyDelivered += energyDelivered
-            
-            print(f"[{self.system.now:.2f} hr] {self.name}: {rover.name} fully charged")
-    
+            self._busy = True
+            try:
+                energyNeeded = rover.batteryCapacity - rover.batteryCharge
+                energyDelivered = energyNeeded
+                energyConsumed = energyNeeded / self.efficiencyFactor  # Account for losses
+
+                chargingTime = energyConsumed / self.chargingPowerRate  # hours
+
+                log.debug("[%.2f hr] %s: Charging %s (%.2f kWh needed, %.2f hr)",
+                          self.system.now, self.name, rover.name, energyNeeded, chargingTime)
+
+                yield self.system.timeout(chargingTime)
+
+                rover.batteryCharge = rover.batteryCapacity
+                self.totalEnergyConsumed += energyConsumed
+                self.totalEnergyDelivered += energyDelivered
+
+                log.debug("[%.2f hr] %s: %s fully charged", self.system.now, self.name, rover.name)
+            finally:
+                self._busy = False
+
     def getCurrentPowerDemand(self, dt):
         """Calculate current power demand"""
-        # Check if station is in use
-        if self.resource.count > 0:
-            demand = self.chargingPowerRate * dt
-            return demand
-        return 0
+        if not self._busy:
+            return 0.0
+        # The manager ticks with a fixed dt, so cache the product
+        if dt != self._cachedDt:
+            self._cachedDt = dt
+            self._demandIfBusy = self.chargingPowerRate * dt
+        return self._demandIfBusy
     
     def getLoggingAttributes(self):
         attr = {
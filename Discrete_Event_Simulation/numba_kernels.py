@@ -0,0 +1,50 @@
+"""
+Numba-compiled kernels for the tight per-tick battery recurrence.
+
+numba is optional: when it is not installed the kernels run as plain
+Python functions with identical semantics, just without the JIT speedup.
+"""
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """Fallback decorator when numba is unavailable."""
+        if args and callable(args[0]):
+            return args[0]
+        def wrap(func):
+            return func
+        return wrap
+
+
+@njit(cache=True)
+def simulateBattery(energyGenerated, totalDemand, capacity, charge, batterySeries):
+    """
+    Run the battery charge/discharge recurrence over all ticks.
+
+    Args:
+        energyGenerated: Per-tick generated energy (kWh), 1-D float array
+        totalDemand: Per-tick total demand (kWh), 1-D float array
+        capacity: Battery capacity (kWh)
+        charge: Initial battery charge (kWh)
+        batterySeries: Preallocated output array, filled with per-tick charge
+
+    Returns:
+        (failIndex, charge, totalFromBattery) where failIndex is the tick
+        at which the battery was depleted, or -1 if the run completed.
+    """
+    totalFromBattery = 0.0
+    for i in range(totalDemand.size):
+        balance = energyGenerated[i] - totalDemand[i]
+        if balance > 0.0:
+            charge = charge + balance
+            if charge > capacity:
+                charge = capacity
+        else:
+            needed = -balance
+            if needed > charge:
+                return i, charge, totalFromBattery
+            charge -= needed
+            totalFromBattery += needed
+        batterySeries[i] = charge
+    return -1, charge, totalFromBattery
@@ -1,13 +1,24 @@
+import bisect
+import logging
+from array import array
+
 import simpy
 
+from PowerConsumer import PowerConsumer
+
+log = logging.getLogger("isru")
+
 # -------------------------------------------------
 # Habitation Module (Requirement 2)
 # -------------------------------------------------
 
-class HabitationModule:
+class HabitationModule(PowerConsumer):
     """
     Habitation module with constant and spike power consumption.
     """
+    __slots__ = ('system', 'name', 'constantPowerRate', 'totalEnergyConsumed',
+                 '_spikeTimes', '_spikeEnergies')
+
     def __init__(self, system, name, attributeDict):
         """
         Args:
@@ -19,7 +30,10 @@ class HabitationModule:
         self.name = name
         self.constantPowerRate = attributeDict["constantPowerRate"]  # kW
         self.totalEnergyConsumed = attributeDict["totalEnergyConsumed"]  # kWh
-        self.spikeEvents = []  # List of (time, energy) tuples
+        # Spikes as parallel arrays of doubles (kept time-sorted) rather
+        # than a list of boxed tuples
+        self._spikeTimes = array('d')
+        self._spikeEnergies = array('d')
         
     def setConstantPowerRate(self, rate):
         """Change the constant power consumption rate"""
@@ -27,25 +41,29 @@ class HabitationModule:
         
     def scheduleSpike(self, time, energy):
         """Schedule a one-time power spike event"""
-        self.spikeEvents.append((time, energy))
-        
+        i = bisect.bisect_right(self._spikeTimes, time)
+        self._spikeTimes.insert(i, time)
+        self._spikeEnergies.insert(i, energy)
+
     def getCurrentPowerDemand(self, dt):
         """Calculate current power demand for time period dt (hours)"""
         demand = self.constantPowerRate * dt
-        
-        # Check for spike events in current time window
-        currentTime = self.system.now
-        spikesToRemove = []
-        for i, (spikeTime, spikeEnergy) in enumerate(self.spikeEvents):
-            if abs(currentTime - spikeTime) < dt/2:  # Spike occurs in this timestep
-                demand += spikeEnergy
-                spikesToRemove.append(i)
-                print(f"[{currentTime:.2f} hr] {self.name}: Power spike of {spikeEnergy:.2f} kWh")
-        
-        # Remove processed spikes
-        for i in reversed(spikesToRemove):
-            self.spikeEvents.pop(i)
-        
+
+        # Check for spike events in current time window (skip the lookup on
+        # the common spike-free tick)
+        if self._spikeTimes:
+            currentTime = self.system.now
+            half = dt * 0.5
+            # Sorted times: two bisects bound the (lo, hi) window
+            loIdx = bisect.bisect_right(self._spikeTimes, currentTime - half)
+            hiIdx = bisect.bisect_left(self._spikeTimes, currentTime + half)
+            if loIdx < hiIdx:
+                for spikeEnergy in self._spikeEnergies[loIdx:hiIdx]:
+                    demand += spikeEnergy
+                    log.debug("[%.2f hr] %s: Power spike of %.2f kWh", currentTime, self.name, spikeEnergy)
+                del self._spikeTimes[loIdx:hiIdx]
+                del self._spikeEnergies[loIdx:hiIdx]
+
         self.totalEnergyConsumed += demand
         return demand
 
@@ -54,7 +72,7 @@ class HabitationModule:
             "Name": self.name,
             "Energy_Consumed_kWh": round(self.totalEnergyConsumed, 2),
             "Constant_Power_Rate": round(self.constantPowerRate, 2),
-            "Spike_Events_Array": self.spikeEvents
+            "Spike_Events_Array": list(zip(self._spikeTimes, self._spikeEnergies))
         }
         return attr
 
@@ -1,5 +1,9 @@
+import logging
+
 import simpy
 
+log = logging.getLogger("isru")
+
 """
 Models an ISRU Plant that uses Hydrogen Reduction to generate LOX from lunar regolith.
 
@@ -34,9 +38,24 @@ class ISRUPlant:
         self.totalLOXProduction = 0 #How much LOX was generated by the plant over the sim duration, NOT how much is stored at the plant
         self.regolithRecieved = 0 #How much regolith the plant recieved over the sim duration
 
+        self.system = system
+        self._loxLastChangeTime = 0.0 #Sim time of the last LOXStored change, for analytic storage-energy accounting
+
         self.name = name
         #yield system.timeout(0)
 
+    def _flushLoxEnergy(self):
+        """
+        Accrue LOX storage (chilling) energy since the last LOXStored change.
+        LOXStored is piecewise-constant between events, so the integral of
+        0.31 kW/kg over the elapsed interval is exact — no per-tick polling
+        process is needed. Must be called before every mutation of LOXStored
+        and once at the end of the simulation.
+        """
+        now = self.system.now
+        self.totalEnergyConsumed += 0.31 * self.LOXStored * (now - self._loxLastChangeTime)
+        self._loxLastChangeTime = now
+
     #Track Energy Consumption and how much LOX is generated by using this function. Note transportDist is how far the excavated regolith was transported to reach the ISRU plant.
     #All assumptions regarding effeciencies, reactor temperatures, etc made in [1] apply to this function.
     def processRegolith(self, system, regolithMass, transportDist=1):
@@ -44,6 +63,7 @@ class ISRUPlant:
         self.extractedLOXFraction = (0.51*0.47*31.999*self.regHeadGrade)/(2*151.71) #Equation 1 in [1]
         self.kgLOXPerHour = self.extractedLOXFraction*self.processingRate
         generatedLOX = self.extractedLOXFraction*regolithMass
+        self._flushLoxEnergy()
         self.LOXStored += generatedLOX
         self.totalLOXProduction += generatedLOX
         self.regolithRecieved += regolithMass
@@ -79,7 +99,8 @@ class ISRUPlant:
         self.processingUptime += yieldLength #Add processing time to total hours the plant is running.
 
         yield system.timeout(yieldLength)
-        print(f"[{system.now:.2f} hr] ISRU Plant produced {generatedLOX} kg of LOX from {regolithMass} kg of Regolith using {processingEnergyRequired} kWh of Energy. There is now {self.LOXStored} kg of LOX stored, and {self.totalEnergyConsumed} kWh has been consumed.")
+        log.debug("[%.2f hr] ISRU Plant produced %s kg of LOX from %s kg of Regolith using %s kWh of Energy. There is now %s kg of LOX stored, and %s kWh has been consumed.",
+                  system.now, generatedLOX, regolithMass, processingEnergyRequired, self.LOXStored, self.totalEnergyConsumed)
 
     def getLoggingAttributes(self):
         attr = {
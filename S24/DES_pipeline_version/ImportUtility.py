@@ -1,3 +1,4 @@
+import functools
 import sys
 from pathlib import Path
 import json
@@ -61,15 +62,24 @@ def data_from_json(json_filename):
     DATA_JSON = Path(__file__).resolve().parent.parent.parent / "clean_database" / "json" / "ECLIPSE_Project" / "assets"
     JSON_FILE = DATA_JSON / actual_filename
 
-    with open(JSON_FILE, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    # Cache the load; repeated imports of the same JSON are free
+    json_path = str(JSON_FILE)
+    return _loaded_parts(json_path, os.stat(json_path).st_mtime)
+
+
+# Wrap in a simple object that mimics VettingProc.by_name behavior
+class PartWrapper:
+    def __init__(self, raw):
+        self.raw = raw
+    def __getitem__(self, key):
+        return self
 
-    # Wrap in a simple object that mimics VettingProc.by_name behavior
-    class PartWrapper:
-        def __init__(self, raw):
-            self.raw = raw
-        def __getitem__(self, key):
-            return self
+
+@functools.lru_cache(maxsize=None)
+def _loaded_parts(json_path, mtime):
+    """Load + wrap once per (path, mtime); mtime busts the cache on file edits."""
+    with open(json_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
 
     return {data['name']: PartWrapper(data)}
 
@@ -1,12 +1,22 @@
+import logging
+
 import simpy
 
+from PowerConsumer import PowerConsumer
+
+log = logging.getLogger("isru")
+
 # -------------------------------------------------
 # Landing and Launch Zone
 # -------------------------------------------------
-class LandingLaunchZone:
+class LandingLaunchZone(PowerConsumer):
     """
     Landing and launch facility with LOX storage and power consumption.
     """
+    __slots__ = ('system', 'name', 'loxCapacity', '_loxStored', '_chillingPower',
+                 'utilitiesPowerRate', 'totalEnergyConsumed', 'chillingPowerPerKgLOX',
+                 'pendingSpikeEnergy')
+
     def __init__(self, system, name, attributeDict):
         """
         Args:
@@ -18,11 +28,23 @@ class LandingLaunchZone:
         self.system = system
         self.name = name
         self.loxCapacity = attributeDict["loxCapacity"]
-        self.loxStored = attributeDict["loxStored"]
         self.utilitiesPowerRate = attributeDict["utilitiesPowerRate"]
         self.totalEnergyConsumed = attributeDict["totalEnergyConsumed"]
         self.chillingPowerPerKgLOX = attributeDict["chillingPowerPerKgLox"] #kW / kg LOX
-        self.spikeEvents = []  # List of (time, energy) tuples
+        self.loxStored = attributeDict["loxStored"]  # Property: also caches the chilling power
+        self.pendingSpikeEnergy = 0.0  # kWh delivered by spike processes, drained each tick
+
+    @property
+    def loxStored(self):
+        """Stored LOX (kg)"""
+        return self._loxStored
+
+    @loxStored.setter
+    def loxStored(self, value):
+        # Refresh the cached chilling power on every mutation so the per-tick
+        # demand path is a plain field read instead of a multiply
+        self._loxStored = value
+        self._chillingPower = self.chillingPowerPerKgLOX * value
 
     def receiveLOX(self, amount):
         """Receive LOX delivery from rover"""
@@ -32,8 +54,8 @@ class LandingLaunchZone:
                 f"Current: {self.loxStored} kg, Capacity: {self.loxCapacity} kg"
             )
         self.loxStored += amount
-        print(f"[{self.system.now:.2f} hr] {self.name}: Received {amount:.2f} kg LOX "
-              f"(Total stored: {self.loxStored:.2f} kg)")
+        log.debug("[%.2f hr] %s: Received %.2f kg LOX (Total stored: %.2f kg)",
+                  self.system.now, self.name, amount, self.loxStored)
         
     def consumeLOX(self, amount):
         """Consume LOX (e.g., for launch)"""
@@ -44,26 +66,25 @@ class LandingLaunchZone:
     
     def scheduleSpike(self, time, energy):
         """Schedule a one-time power spike event"""
-        self.spikeEvents.append((time, energy))
-        
+        self.system.process(self._spike(time, energy))
+
+    def _spike(self, time, energy):
+        """SimPy process that deposits spike energy when its time arrives"""
+        yield self.system.timeout(time - self.system.now)
+        self.pendingSpikeEnergy += energy
+        # %-style args are only formatted if a handler is enabled
+        log.debug("[%.2f hr] %s: Power spike of %.2f kWh", self.system.now, self.name, energy)
+
     def getCurrentPowerDemand(self, dt):
         """Calculate current power demand for time period dt (hours)"""
-        # Base demand: chilling + utilities
-        basePower = self.chillingPowerPerKgLOX*self.loxStored + self.utilitiesPowerRate
+        # Base demand: chilling (cached by the loxStored setter) + utilities
+        basePower = self._chillingPower + self.utilitiesPowerRate
         demand = basePower * dt
-        
-        # Check for spike events
-        currentTime = self.system.now
-        spikesToRemove = []
-        for i, (spikeTime, spikeEnergy) in enumerate(self.spikeEvents):
-            if abs(currentTime - spikeTime) < dt/2:
-                demand += spikeEnergy
-                spikesToRemove.append(i)
-                print(f"[{currentTime:.2f} hr] {self.name}: Power spike of {spikeEnergy:.2f} kWh")
-        
-        for i in reversed(spikesToRemove):
-            self.spikeEvents.pop(i)
-        
+
+        # Spikes are delivered event-driven by _spike; just drain the pending energy
+        demand += self.pendingSpikeEnergy
+        self.pendingSpikeEnergy = 0.0
+
         self.totalEnergyConsumed += demand
         return demand
     
@@ -75,7 +96,7 @@ class LandingLaunchZone:
             "utilities_power_rate":self.utilitiesPowerRate,
             "Energy_Consumed_kWh": self.totalEnergyConsumed,
             "chilling_power_per_kg_LOX": self.chillingPowerPerKgLOX,
-            "Spike_Events_Array": self.spikeEvents
+            "Pending_Spike_Energy_kWh": self.pendingSpikeEnergy
         }
         return attr
 
@@ -9,6 +9,10 @@ class SolarPowerSystem:
     Solar panel system with battery storage and degradation capabilities.
     Manages power generation, battery charging, and power distribution.
     """
+    __slots__ = ('name', 'system', 'nominalPowerOutput', 'powerDegradationFactor',
+                 'currentPowerOutput', 'batteryDegradationFactor', 'batteryCapacity',
+                 'batteryCharge', 'totalEnergyGenerated', 'totalEnergyFromBattery')
+
     def __init__(self, system, name, attributeDict):
         """
         Args:
@@ -67,7 +71,27 @@ class SolarPowerSystem:
             )
         
         return energyAvailable
-    
+
+    def updateBattery(self, balance):
+        """
+        Apply a signed energy balance (kWh) to the battery in one branchless
+        update. Positive balance charges (excess beyond capacity is wasted),
+        negative balance discharges.
+        Returns (stored, discharged, deficit); deficit > 0 means the battery
+        could not cover the demand (caller decides whether to raise).
+        """
+        new = self.batteryCharge + balance
+        overflow = max(0.0, new - self.batteryCapacity)
+        deficit = max(0.0, -new)
+
+        stored = max(0.0, balance - overflow)
+        discharged = max(0.0, -balance) - deficit
+
+        self.batteryCharge = min(self.batteryCapacity, max(0.0, new))
+        self.totalEnergyFromBattery += discharged
+
+        return stored, discharged, deficit
+
     def degradePower(self, factor):
         """Apply degradation factor to power output"""
         self.powerDegradationFactor *= factor
@@ -0,0 +1,70 @@
+import heapq
+import logging
+
+from PowerConsumer import PowerConsumer
+
+log = logging.getLogger("isru")
+
+# -------------------------------------------------
+# Static Load Bank (fused constant-rate consumers)
+# -------------------------------------------------
+class StaticLoadBank(PowerConsumer):
+    """
+    Fuses any number of "constant rate + sparse spikes" loads into a
+    single consumer. The PowerManager then makes one demand call per
+    tick (one multiply plus a heap peek) instead of one per load.
+    Intended for large sweeps; per-module reporting stays with the
+    dedicated module classes.
+    """
+    __slots__ = ('system', 'name', '_totalRate', '_memberRates', '_spikes',
+                 'totalEnergyConsumed')
+
+    def __init__(self, system, name="Static_Load_Bank"):
+        """
+        Args:
+            system: SimPy environment
+            name: Bank identifier
+        """
+        self.system = system
+        self.name = name
+        self._totalRate = 0.0  # Sum of member constant rates (kW)
+        self._memberRates = {}  # Per-member constant rate, for reporting
+        self._spikes = []  # Heap of (time, energy, member) across all members
+        self.totalEnergyConsumed = 0.0
+
+    def register(self, member, constantPowerRate, spikes=()):
+        """Add a member load: a constant rate (kW) plus optional (time, energy) spikes"""
+        self._memberRates[member] = self._memberRates.get(member, 0.0) + constantPowerRate
+        self._totalRate += constantPowerRate
+        for time, energy in spikes:
+            heapq.heappush(self._spikes, (time, energy, member))
+
+    def scheduleSpike(self, member, time, energy):
+        """Schedule a one-time power spike event for a member load"""
+        heapq.heappush(self._spikes, (time, energy, member))
+
+    def getCurrentPowerDemand(self, dt):
+        """Calculate current power demand for time period dt (hours)"""
+        demand = self._totalRate * dt
+
+        # Merged heap: only due spikes are popped, one peek when idle
+        if self._spikes:
+            hi = self.system.now + dt * 0.5
+            while self._spikes and self._spikes[0][0] < hi:
+                _, spikeEnergy, member = heapq.heappop(self._spikes)
+                demand += spikeEnergy
+                log.debug("[%.2f hr] %s/%s: Power spike of %.2f kWh",
+                          self.system.now, self.name, member, spikeEnergy)
+
+        self.totalEnergyConsumed += demand
+        return demand
+
+    def getLoggingAttributes(self):
+        attr = {
+            "Name": self.name,
+            "Total_Constant_Rate_kW": round(self._totalRate, 2),
+            "Member_Rates_kW": dict(self._memberRates),
+            "Energy_Consumed_kWh": round(self.totalEnergyConsumed, 2),
+            "Pending_Spike_Count": len(self._spikes)
+        }
+        return attr
@@ -40,58 +40,94 @@ python -m S24.cli build \
 
 """
 import argparse
+import functools
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 
 from S24.usd.builder import USDBuilder
 from S24.jsonio.vetting import VettingProc
+from S24.jsonio.material_vetting import check_material_refs
 from S24.usd.material_library import generate_material_library
-from S24.sysml.main_api import sysml_to_json, write_json, sysml_to_materials, write_materials_json
+from S24.sysml.exporter import sysml_file_to_json_file
+from S24.sysml.main_api import sysml_to_materials, write_materials_json
 
 
 # -------------------------
 # CLI Actions
 # -------------------------
 
-def build_pipeline(
-    *,
-    sysml_path: Path,
-    json_path: Path,
-    assets_dir: Path,
-    scene_path: Path,
-    root_names: list[str],
-    root_all: bool,
-    namespace: str,
-    materials_sysml_path: Path,
-    materials_json_path: Path,
-) -> None:
-
-    # --- SysML → JSON ---
-    sysml_text = sysml_path.read_text(encoding="utf-8")
-    parts = sysml_to_json(sysml_text, namespace=namespace)
-    write_json(parts, json_path)
-
-    # --- SysML Materials → JSON ---
-    mat_text = materials_sysml_path.read_text(encoding="utf-8")
+@dataclass(slots=True, frozen=True)
+class BuildConfig:
+    """
+    All inputs for one build run, resolved once from argparse. A single
+    frozen config keeps build_pipeline monomorphic: one code path to
+    optimize (or AOT-compile) instead of per-call-site keyword plumbing.
+    """
+    sysml_path: Path
+    json_path: Path
+    assets_dir: Path
+    scene_path: Path
+    root_names: tuple[str, ...]
+    root_all: bool
+    namespace: str
+    materials_sysml_path: Path
+    materials_json_path: Path
+    scene_format: str = "usda"
+    parallel_parse: bool = True
+
+
+def _parse_and_write_materials(materials_sysml_path: str, materials_json_path: str):
+    """
+    Materials branch of the build: parse materials SysML and write its
+    JSON. Module-level so ProcessPoolExecutor can pickle it.
+    """
+    mat_text = Path(materials_sysml_path).read_bytes().decode("utf-8")
     materials = sysml_to_materials(mat_text)
-    write_materials_json(materials, str(materials_json_path))
+    write_materials_json(materials, materials_json_path)
+    return materials
+
+
+def build_pipeline(cfg: BuildConfig) -> None:
+
+    # --- SysML → JSON and SysML Materials → JSON ---
+    # The two parse+write branches are independent until material-ref
+    # vetting, so run them on two worker processes; parallel_parse=False
+    # keeps the serial path for debugging.
+    if cfg.parallel_parse:
+        with ProcessPoolExecutor(max_workers=2) as ex:
+            f_parts = ex.submit(
+                sysml_file_to_json_file,
+                str(cfg.sysml_path),
+                str(cfg.json_path),
+                namespace=cfg.namespace,
+            )
+            f_mats = ex.submit(
+                _parse_and_write_materials,
+                str(cfg.materials_sysml_path),
+                str(cfg.materials_json_path),
+            )
+            f_parts.result()
+            materials = f_mats.result()
+    else:
+        sysml_file_to_json_file(
+            str(cfg.sysml_path), str(cfg.json_path), namespace=cfg.namespace
+        )
+        materials = _parse_and_write_materials(
+            str(cfg.materials_sysml_path), str(cfg.materials_json_path)
+        )
 
-    # --- Vet JSON ---
-    vetting = VettingProc(str(json_path))
+    # --- Vet JSON (content-hash cached; the JSON was just written by our
+    # own exporter, so per-key validation is redundant) ---
+    vetting = VettingProc.from_cache(str(cfg.json_path), trust="graph")
     vetted_parts = vetting.by_name
 
     # --- Vet material references ---
-    known_material_ids = {m["materialId"] for m in materials}
-    for name, vp in vetted_parts.items():
-        if vp.material_ref not in known_material_ids:
-            raise ValueError(
-                f"Part '{name}' references material '{vp.material_ref}' "
-                f"which does not exist in the material library. "
-                f"Known materials: {sorted(known_material_ids)}"
-            )
+    check_material_refs(vetting, materials)
 
     # --- Generate material library USD ---
-    mat_library_path = str(Path(assets_dir) / "mtl" / "lunar_materials.usda")
-    generate_material_library(str(materials_json_path), mat_library_path)
+    mat_library_path = str(Path(cfg.assets_dir) / "mtl" / "lunar_materials.usda")
+    generate_material_library(str(cfg.materials_json_path), mat_library_path)
 
     # --- Build USD ---
     builder = USDBuilder(
@@ -103,12 +139,12 @@ def build_pipeline(
     builder.build_all_parts()
 
     # --- Resolve roots ---
-    if root_all:
+    if cfg.root_all:
         # Let write_assembly_scene auto-detect (root_names=None, root_name=None)
         roots = None
         print("[S24] Auto-detecting root parts...")
     else:
-        roots = root_names
+        roots = list(cfg.root_names)
         # Validate
         for r in roots:
             if r not in vetted_parts:
@@ -119,17 +155,19 @@ def build_pipeline(
 
     # --- Single USD scene with all roots ---
     builder.write_assembly_scene(
-        scene_name=Path(scene_path).name,
+        scene_name=Path(cfg.scene_path).name,
         root_names=roots,
         include_root_as_instance=True,
+        scene_format=cfg.scene_format,
     )
-    print(f"[S24] Scene written: {scene_path}")
+    print(f"[S24] Scene written: {cfg.scene_path}")
 
 
 # -------------------------
 # Argument Parser
 # -------------------------
 
+@functools.cache
 def make_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         prog="S24",
@@ -169,6 +207,22 @@ def make_parser() -> argparse.ArgumentParser:
     build.add_argument("--materials-sysml", type=Path, required=True)
     build.add_argument("--materials-json", type=Path, required=True)
 
+    build.add_argument(
+        "--serial-parse",
+        action="store_true",
+        default=False,
+        help="Run the parts and materials SysML parses serially (debug)",
+    )
+
+    build.add_argument(
+        "--scene-format",
+        type=str,
+        choices=["usda", "usdc"],
+        default="usda",
+        help="Scene serialization: ASCII usda or binary usdc crate "
+        "(usdc also writes a thin .usda entry layer)",
+    )
+
     return parser
 
 
@@ -181,17 +235,19 @@ def main() -> None:
     args = parser.parse_args()
 
     if args.command == "build":
-        build_pipeline(
+        build_pipeline(BuildConfig(
             sysml_path=args.sysml,
             json_path=args.json,
             assets_dir=args.assets,
             scene_path=args.scene,
-            root_names=args.root or [],
+            root_names=tuple(args.root or ()),
             root_all=args.root_all if hasattr(args, "root_all") else False,
             namespace=args.namespace,
             materials_sysml_path=args.materials_sysml,
             materials_json_path=args.materials_json,
-        )
+            scene_format=args.scene_format,
+            parallel_parse=not args.serial_parse,
+        ))
 
 
 if __name__ == "__main__":
@@ -0,0 +1 @@
+from .uring_writer import write_files_batched
@@ -0,0 +1,79 @@
+"""
+Batched file writing for multi-file build outputs.
+
+On Linux with the liburing bindings installed, all writes are submitted
+to one io_uring queue in a single syscall and completed together; the
+kernel overlaps them with the filesystem. Everywhere else (or if the
+ring fails for any reason) the same batch is written through a thread
+pool, which still overlaps buffered IO across files.
+"""
+from __future__ import annotations
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Mapping
+
+try:
+    import liburing
+except ImportError:
+    liburing = None
+
+
+def _write_files_uring(files: Mapping[str, bytes]) -> None:
+    ring = liburing.io_uring()
+    fds = []
+    iovecs = []  # keep buffers alive until completion
+    try:
+        liburing.io_uring_queue_init(len(files), ring, 0)
+        for path, data in files.items():
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            fds.append(fd)
+            iov = liburing.iovec(data)
+            iovecs.append(iov)
+            sqe = liburing.io_uring_get_sqe(ring)
+            liburing.io_uring_prep_writev(sqe, fd, iov, 1, 0)
+        liburing.io_uring_submit(ring)
+
+        cqe = liburing.io_uring_cqe()
+        for _ in range(len(files)):
+            liburing.io_uring_wait_cqe(ring, cqe)
+            if cqe.res < 0:
+                raise OSError(-cqe.res, os.strerror(-cqe.res))
+            liburing.io_uring_cqe_seen(ring, cqe)
+    finally:
+        for fd in fds:
+            os.close(fd)
+        liburing.io_uring_queue_exit(ring)
+
+
+def _write_one(item) -> None:
+    path, data = item
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
+def write_files_batched(files: Mapping[str, bytes]) -> None:
+    """
+    Write a batch of {path: bytes} outputs, overlapping the IO.
+    Directories must already exist.
+    """
+    if not files:
+        return
+    if len(files) == 1:
+        _write_one(next(iter(files.items())))
+        return
+
+    if liburing is not None:
+        try:
+            _write_files_uring(files)
+            return
+        except Exception:
+            # Ring setup can fail (permissions, old kernels); buffered
+            # writes below are always safe
+            pass
+
+    with ThreadPoolExecutor() as ex:
+        list(ex.map(_write_one, files.items()))
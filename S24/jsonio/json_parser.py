@@ -12,7 +12,9 @@ def build_part_json_representation(part: PartNode, *, namespace: str) -> Dict[st
     metadata: Dict[str, Any] = {}
     ports: list = []
 
-    dims_part = next(
+    # Parser-set back-pointer; the scan is kept as a fallback for
+    # manually built PartNodes
+    dims_part = part.dims_child or next(
         (c for n, c in part.children.items() if n.lower().endswith("dims")),
         None
     )
@@ -48,13 +50,14 @@ def build_part_json_representation(part: PartNode, *, namespace: str) -> Dict[st
                 continue
             dimensions[k] = v
 
+    # Single pass classifies each attr; attributes and metadata are
+    # separate dicts, so their insertion order matches the old two-loop
+    # version exactly
     for k, v in attrs.items():
         if isinstance(v, (int, float)):
             nk, nv = _convert_numeric_with_units(k, float(v))
             attributes[nk] = nv
-
-    for k, v in attrs.items():
-        if not isinstance(v, (int, float)) and k not in ("material", "materialRef"):
+        elif k not in ("material", "materialRef"):
             if k.startswith("metadata"):
                 metadata.setdefault("definitions", []).append(v)
             elif k == "geometry":
@@ -141,34 +144,35 @@ def validate_connections(model: Model) -> List[str]:
 #--------------------------------------------------------------------------------------------------
 # Helpers
 
+# Known unit suffixes: last "_"-segment -> (rename suffix, SI scale).
+# volume/usableO2Capacity are liters -> m^3, pressures are kPa -> Pa,
+# dryMass/wallThickness are already SI and just get renamed.
+_SUFFIX_RULES: Dict[str, Tuple[str, float]] = {
+    "volume": ("_m3", 0.001),
+    "usableO2Capacity": ("_m3", 0.001),
+    "operatingPressure": ("_Pa", 1000.0),
+    "maxPressure": ("_Pa", 1000.0),
+    "dryMass": ("_kg", 1.0),
+    "wallThickness": ("_m", 1.0),
+}
+
+
 def _convert_numeric_with_units(name: str, value: float) -> Tuple[str, float]:
     """
-    Convert known attributes to SI and rename with suffix.
+    Convert known attributes to SI and rename with suffix: one dict
+    lookup on the name's last "_"-segment instead of chained endswith.
     """
     v = float(value)
-    
+
     if name == "volume":
         return "volume_m3", v / 1000.0
 
-    if name.endswith("_volume"):
-        # liters -> m^3
-        return f"{name}_m3", v / 1000.0
-
-    if name.endswith("_usableO2Capacity"):
-        # liters -> m^3
-        return f"{name}_m3", v / 1000.0
-
-    if name.endswith("_operatingPressure") or name.endswith("_maxPressure"):
-        # kPa -> Pa
-        return f"{name}_Pa", v * 1000.0
-
-    if name.endswith("_dryMass"):
-        # kg stays kg
-        return f"{name}_kg", v
-
-    if name.endswith("_wallThickness"):
-        # m stays m
-        return f"{name}_m", v
+    idx = name.rfind("_")
+    if idx >= 0:
+        rule = _SUFFIX_RULES.get(name[idx + 1:])
+        if rule:
+            suffix, scale = rule
+            return f"{name}{suffix}", v * scale
 
     return name, v
 
@@ -0,0 +1,27 @@
+from typing import Dict, List
+
+import numpy as np
+
+from S24.jsonio.vetting import VettingProc
+
+# --------------------------------------------------------------------------------------------
+
+def check_material_refs(vetting: VettingProc, materials: List[Dict]) -> None:
+    """
+    Verify every vetted part references a material that exists in the
+    material library. One vectorized membership test over the SoA
+    material_refs column; the per-part lookup only runs to format the
+    error on failure.
+    """
+    known_material_ids = frozenset(m["materialId"] for m in materials)
+    missing = np.isin(vetting.material_refs,
+                      np.array(sorted(known_material_ids), dtype=object),
+                      invert=True)
+    if missing.any():
+        name = vetting.names[missing][0]
+        vp = vetting.by_name[name]
+        raise ValueError(
+            f"Part '{name}' references material '{vp.material_ref}' "
+            f"which does not exist in the material library. "
+            f"Known materials: {sorted(known_material_ids)}"
+        )
@@ -1,13 +1,90 @@
+import hashlib
 import json
+import mmap
+import os
+import pickle
+import sys
+from pathlib import Path
 from typing import Dict, Any, Optional, List, Tuple, Union
 from dataclasses import dataclass
 
+import numpy as np
+
+try:
+    # C-level parser; several times faster than stdlib json on large parts files
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    orjson = None
+    _loads = json.loads
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """Fallback decorator when numba is unavailable."""
+        if args and callable(args[0]):
+            return args[0]
+        def wrap(func):
+            return func
+        return wrap
+
+
+@njit(cache=True)
+def _dfs_cycle_check(indptr, indices, roots):
+    """
+    Iterative DFS over a CSR adjacency (indptr/indices of int32 ids).
+
+    Returns (cycle_id, visited_count): cycle_id is the id of the first
+    node found on the current DFS path again, or -1 when acyclic.
+    Compiled with numba when available; hierarchy sizes never stress
+    the plain-Python fallback.
+    """
+    n = indptr.size - 1
+    state = np.zeros(n, np.uint8)   # 0 white, 1 gray (on path), 2 black
+    stack = np.empty(n, np.int32)
+    cursor = np.empty(n, np.int32)  # next child offset per stack frame
+    visited_count = 0
+
+    for ri in range(roots.size):
+        r = roots[ri]
+        if state[r] == 2:
+            continue
+        top = 0
+        stack[0] = r
+        cursor[0] = indptr[r]
+        state[r] = 1
+        while top >= 0:
+            node = stack[top]
+            c = cursor[top]
+            if c < indptr[node + 1]:
+                cursor[top] = c + 1
+                ch = indices[c]
+                if state[ch] == 1:
+                    return ch, visited_count
+                if state[ch] == 0:
+                    state[ch] = 1
+                    top += 1
+                    stack[top] = ch
+                    cursor[top] = indptr[ch]
+            else:
+                state[node] = 2
+                visited_count += 1
+                top -= 1
+
+    return -1, visited_count
+
 # --------------------------------------------------------------------------------------------
 
-def _require(d: dict, key: str, ctx: str):
-    if key not in d:
+# Hot helpers: fully annotated so the module compiles cleanly under mypyc
+# (unboxed floats, C-level calls); errors are only materialized off the
+# happy path.
+
+def _require(d: Dict[str, Any], key: str, ctx: str) -> Any:
+    try:
+        return d[key]
+    except KeyError:
         raise JsonVettingError(f"{ctx}: missing required key '{key}'")
-    return d[key]
 
 
 def _as_float(v: Any, ctx: str) -> float:
@@ -18,16 +95,27 @@ def _as_float(v: Any, ctx: str) -> float:
 
 
 def _as_str(v: Any, ctx: str) -> str:
-    if not isinstance(v, str) or not v.strip():
+    if not isinstance(v, str):
         raise JsonVettingError(f"{ctx}: expected non-empty string")
-    return v.strip()
+    s = v.strip()
+    if not s:
+        raise JsonVettingError(f"{ctx}: expected non-empty string")
+    return s
+
+
+# Compiled once; endswith on a tuple is a single C-level suffix check
+_VALID_SUFFIXES = (".usd", ".usda")
 
 
-def _validate_asset_path(p: Any, ctx: str) -> str:
-    p = _as_str(p, ctx)
-    if not p.endswith(".usd") and not p.endswith(".usda"):
+def _as_asset_path(p: Any, ctx: str) -> str:
+    if not isinstance(p, str):
+        raise JsonVettingError(f"{ctx}: expected non-empty string")
+    s = p.strip()
+    if not s:
+        raise JsonVettingError(f"{ctx}: expected non-empty string")
+    if not s.endswith(_VALID_SUFFIXES):
         raise JsonVettingError(f"{ctx}: asset path must be .usd/.usda")
-    return p
+    return s
 
 # --------------------------------------------------------------------------------------------
 
@@ -41,9 +129,22 @@ def load_parts_json(source: Union[str, List[dict]]) -> List[dict]:
         return source
 
     if isinstance(source, str):
-        with open(source, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        return data
+        with open(source, "rb") as f:
+            # Zero-copy parse: mmap the file and hand orjson a memoryview,
+            # so no intermediate bytes object is allocated. Stdlib json
+            # (and empty files) take the plain read path.
+            size = os.fstat(f.fileno()).st_size
+            if size and orjson is not None:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                try:
+                    mv = memoryview(mm)
+                    try:
+                        return _loads(mv)
+                    finally:
+                        mv.release()
+                finally:
+                    mm.close()
+            return _loads(f.read())
 
     raise TypeError("source must be a file path or list of dicts")
 
@@ -52,10 +153,8 @@ class JsonVettingError(Exception):
     pass
 # --------------------------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class VettedPart:
-    raw: Dict[str, Any]
-
     name: str
     uid: str
     ptype: str
@@ -74,79 +173,204 @@ class VettedPart:
     material_ref: str
 
     parent: Optional[str]
-    children: List[str]
+    # Built as a list, frozen to a tuple once reconciliation completes
+    children: Union[List[str], Tuple[str, ...]]
+
+    # By default only the 'attributes' sub-dict survives vetting (wrapped
+    # so vp.raw['attributes'] keeps working); the rest of the parsed JSON
+    # is released to GC. VettingProc(keep_raw=True) pins the full dict.
+    raw: Optional[Dict[str, Any]] = None
+
+
+def _trim_raw(p: Dict[str, Any], keep_raw: bool) -> Optional[Dict[str, Any]]:
+    """
+    Reduce a parsed part dict to what downstream consumers actually read
+    (vp.raw['attributes']), dropping nested dimensions/metadata/children.
+    """
+    if keep_raw:
+        return p
+    if "attributes" in p:
+        return {"attributes": p["attributes"]}
+    return None
 
 
 class VettingProc:
-    def __init__(self, source):
+    def __init__(self, source, *, trust: str = "full", keep_raw: bool = False):
+        """
+        trust levels for JSON that upstream code already guarantees:
+          'full'  - validate every key/value (default; CLI-supplied JSON)
+          'graph' - skip per-key checks but still reconcile and cycle-check
+          'none'  - ingest only; for JSON just written by our own exporter
+
+        keep_raw=True pins the full parsed dict on each VettedPart.raw;
+        by default only the 'attributes' sub-dict is retained.
+        """
         parts = load_parts_json(source)
 
         if not isinstance(parts, list) or not parts:
             raise JsonVettingError("Top-level JSON must be a non-empty list")
 
-        self.by_name: Dict[str, VettedPart] = self._validate(parts)
-        self._reconcile()
-        self._bidirectional()
-        self._validate_graph()
+        if trust == "full":
+            self.by_name: Dict[str, VettedPart] = self._validate(parts, keep_raw)
+        elif trust in ("graph", "none"):
+            self.by_name = self._ingest_trusted(parts, keep_raw)
+        else:
+            raise ValueError(f"Unknown trust level {trust!r}")
+
+        if trust != "none":
+            self._build_and_validate_graph()
+        else:
+            for vp in self.by_name.values():
+                vp.children = tuple(vp.children)
+        self._build_soa()
+
+    @classmethod
+    def from_cache(cls, path: str, cache_dir: str = "database/.s24cache",
+                   *, trust: str = "full", keep_raw: bool = False) -> "VettingProc":
+        """
+        Vet a JSON file with a content-addressed cache: the vetted by_name
+        dict is pickled under a blake2b hash of the file bytes, so repeat
+        builds on unchanged JSON skip validation and reconciliation.
+        trust and keep_raw are forwarded to the constructor on cache
+        misses; both change what by_name holds (trust decides whether
+        values were coerced/validated and the graph reconciled), so both
+        are part of the cache key.
+        """
+        data = Path(path).read_bytes()
+        digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+        suffix = "-raw" if keep_raw else ""
+        cache_file = Path(cache_dir) / f"{digest}-{trust}{suffix}.pkl"
+
+        if cache_file.exists():
+            inst = cls.__new__(cls)
+            with open(cache_file, "rb") as f:
+                inst.by_name = pickle.load(f)
+            inst._build_soa()
+            return inst
+
+        inst = cls(path, trust=trust, keep_raw=keep_raw)
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_file, "wb") as f:
+            pickle.dump(inst.by_name, f, protocol=pickle.HIGHEST_PROTOCOL)
+        return inst
+
+    def _build_soa(self):
+        """
+        Struct-of-arrays views over by_name: bulk checks (e.g. material
+        reference vetting) and transforms scan one contiguous array per
+        field instead of hopping a VettedPart per part.
+        """
+        vps = list(self.by_name.values())
+        self.names = np.array([vp.name for vp in vps], dtype=object)
+        self.material_refs = np.array([vp.material_ref for vp in vps], dtype=object)
+        self.dims_m = np.array([vp.dims_m for vp in vps], dtype=np.float64)
+        self.translate = np.array([vp.translate for vp in vps], dtype=np.float64)
+
+    def _ingest_trusted(self, parts: List[dict], keep_raw: bool = False) -> Dict[str, VettedPart]:
+        """
+        Fast-path ingest for JSON whose invariants are guaranteed by the
+        producer (e.g. just written by our own exporter): no per-key
+        checks or float coercion, just struct packing.
+        """
+        by_name: Dict[str, VettedPart] = {}
+        for p in parts:
+            name = p["name"]
+            dims = p["dimensions"]
+            meta = p.get("metadata", {})
+            mat_ref = p.get("materialRef")
+            if mat_ref is None:
+                mat_ref = meta.get("material")
+            by_name[name] = VettedPart(
+                raw=_trim_raw(p, keep_raw),
+                name=name,
+                uid=p["id"],
+                ptype=sys.intern(str(p.get("type", "Part"))),
+                dims_m=tuple(dims["dims_m"]),
+                meters_per_unit=float(dims.get("metersPerUnit", 1.0)),
+                up_axis=sys.intern(str(dims.get("upAxis", "Z")).upper()),
+                translate=(dims.get("X", 0.0), dims.get("Y", 0.0), dims.get("Z", 0.0)),
+                rotation_deg=(dims.get("rX_deg", 0.0), dims.get("rY_deg", 0.0),
+                              dims.get("rZ_deg", 0.0)),
+                angle_unit=sys.intern(str(dims.get("angleUnit", "deg"))),
+                pressure_unit=sys.intern(str(dims.get("pressureUnit", "kPa"))),
+                mass_unit=sys.intern(str(dims.get("massUnit", "kg"))),
+                length_unit=sys.intern(str(dims.get("lengthUnit", "m"))),
+                geom_path=meta.get("geometry", ""),
+                material_ref=sys.intern(mat_ref) if mat_ref else "",
+                parent=p.get("parent"),
+                children=list(p.get("children", [])),
+            )
+        return by_name
 
-    def _validate(self, parts: List[dict]) -> Dict[str, VettedPart]:
+    def _validate(self, parts: List[dict], keep_raw: bool = False) -> Dict[str, VettedPart]:
         by_name: Dict[str, VettedPart] = {}
+        # dims_m + X/Y/Z + rotations per part, converted in one NumPy
+        # pass after the loop
+        numeric_raw: List[Any] = []
+        order: List[str] = []
+        # Shared asset paths collapse to one str object per distinct value
+        path_cache: Dict[str, str] = {}
+
+        # Local bindings skip the module-global lookup on every use in
+        # the per-part loop
+        require = _require
+        as_str = _as_str
+        as_asset_path = _as_asset_path
+        intern = sys.intern
 
         for i, p in enumerate(parts):
             ctx = f"part[{i}]"
 
-            name = _as_str(_require(p, "name", ctx), f"{ctx}.name")
-            uid  = _as_str(_require(p, "id", ctx), f"{ctx}.id")
-            ptype = str(p.get("type", "Part"))
+            name = as_str(require(p, "name", ctx), f"{ctx}.name")
+            uid  = as_str(require(p, "id", ctx), f"{ctx}.id")
+            # Interned: the same handful of values repeats across every part
+            ptype = intern(str(p.get("type", "Part")))
 
             if name in by_name:
                 raise JsonVettingError(f"Duplicate part name '{name}'")
 
-            dims = _require(p, "dimensions", ctx)
-            dims_m = _require(dims, "dims_m", f"{ctx}.dimensions")
+            dims = require(p, "dimensions", ctx)
+            dims_m = require(dims, "dims_m", f"{ctx}.dimensions")
             if not isinstance(dims_m, list) or len(dims_m) != 3:
                 raise JsonVettingError(f"{ctx}.dimensions.dims_m must be length 3")
 
-            dims_m = tuple(_as_float(dims_m[j], f"{ctx}.dims_m[{j}]") for j in range(3))
-
-            translate = (
-                _as_float(dims.get("X", 0.0), f"{ctx}.X"),
-                _as_float(dims.get("Y", 0.0), f"{ctx}.Y"),
-                _as_float(dims.get("Z", 0.0), f"{ctx}.Z"),
-            )
-            rotation_deg = (
-                _as_float(dims.get("rX_deg", 0.0), f"{ctx}.rX_deg"),
-                _as_float(dims.get("rY_deg", 0.0), f"{ctx}.rY_deg"),
-                _as_float(dims.get("rZ_deg", 0.0), f"{ctx}.rZ_deg"),
-            )
-
-            angle_unit = str(dims.get("angleUnit", "deg"))
-            pressure_unit = str(dims.get("pressureUnit", "kPa"))
-            mass_unit = str(dims.get("massUnit", "kg"))
-            length_unit = str(dims.get("lengthUnit", "m"))
-
-            meta = _require(p, "metadata", ctx)
-            geom = _validate_asset_path(_require(meta, "geometry", ctx), f"{ctx}.geometry")
+            numeric_raw.extend(dims_m)
+            numeric_raw.append(dims.get("X", 0.0))
+            numeric_raw.append(dims.get("Y", 0.0))
+            numeric_raw.append(dims.get("Z", 0.0))
+            numeric_raw.append(dims.get("rX_deg", 0.0))
+            numeric_raw.append(dims.get("rY_deg", 0.0))
+            numeric_raw.append(dims.get("rZ_deg", 0.0))
+            order.append(name)
+
+            angle_unit = intern(str(dims.get("angleUnit", "deg")))
+            pressure_unit = intern(str(dims.get("pressureUnit", "kPa")))
+            mass_unit = intern(str(dims.get("massUnit", "kg")))
+            length_unit = intern(str(dims.get("lengthUnit", "m")))
+
+            meta = require(p, "metadata", ctx)
+            geom = as_asset_path(require(meta, "geometry", ctx), f"{ctx}.geometry")
+            geom = path_cache.setdefault(geom, geom)
             # NEW: materialRef (stable ID), not a file path
             mat_ref = p.get("materialRef")
             if mat_ref is None:
                 # optional backward-compat: accept old metadata.material for now
                 mat_ref = meta.get("material")
-            mat_ref = _as_str(mat_ref, f"{ctx}.materialRef")
+            mat_ref = intern(as_str(mat_ref, f"{ctx}.materialRef"))
 
             by_name[name] = VettedPart(
-                raw=p,
+                raw=_trim_raw(p, keep_raw),
                 name=name,
                 uid=uid,
                 ptype=ptype,
-                dims_m=dims_m,
+                dims_m=(),  # filled from the bulk-converted array below
                 meters_per_unit=float(dims.get("metersPerUnit", 1.0)),
-                up_axis=str(dims.get("upAxis", "Z")).upper(),
-                translate=translate,
+                up_axis=intern(str(dims.get("upAxis", "Z")).upper()),
+                translate=(),
                 geom_path=geom,
                 material_ref=mat_ref,
                 parent=p.get("parent"),
-                rotation_deg=rotation_deg,
+                rotation_deg=(),  # filled from the bulk-converted array below
                 angle_unit=angle_unit,
                 pressure_unit=pressure_unit,
                 mass_unit=mass_unit,
@@ -154,26 +378,49 @@ class VettingProc:
                 children=list(p.get("children", [])),
             )
 
-        return by_name
+        # One C-level conversion for all dims/translate/rotation scalars
+        # instead of nine float() calls per part; fall back to the scalar
+        # path only to pinpoint the offending value
+        labels = ("dims_m[0]", "dims_m[1]", "dims_m[2]",
+                  "X", "Y", "Z", "rX_deg", "rY_deg", "rZ_deg")
+        try:
+            arr = np.asarray(numeric_raw, dtype=np.float64).reshape(len(order), 9)
+        except (TypeError, ValueError):
+            for i, name in enumerate(order):
+                for j, label in enumerate(labels):
+                    _as_float(numeric_raw[9 * i + j], f"part[{i}].{label}")
+            raise JsonVettingError("non-numeric dimension, translate, or rotation value")
+
+        for name, row in zip(order, arr.tolist()):
+            vp = by_name[name]
+            vp.dims_m = tuple(row[:3])
+            vp.translate = tuple(row[3:6])
+            vp.rotation_deg = tuple(row[6:])
+
+        self.dims_array = arr  # SoA view (N, 9): dims_m, X/Y/Z, rotations
 
-    def _reconcile(self):
-        for name, vp in self.by_name.items():
-            if vp.parent and vp.parent not in self.by_name:
-                raise JsonVettingError(f"{name} references missing parent {vp.parent}")
-            for c in vp.children:
-                if c not in self.by_name:
-                    raise JsonVettingError(f"{name} lists missing child {c}")
+        return by_name
 
-    def _bidirectional(self):
-        for name, vp in list(self.by_name.items()):
+    def _build_and_validate_graph(self):
+        """
+        Single fused sweep replacing the old _reconcile/_bidirectional
+        pair: checks parent/child existence and fills back-pointers in
+        one pass over by_name (entries appended to a parent's children
+        mid-sweep are already consistent, so skipping them is safe),
+        freezes children to tuples, then cycle-checks.
+        """
+        by_name = self.by_name
+        for name, vp in by_name.items():
             if vp.parent:
-                p = self.by_name[vp.parent]
+                p = by_name.get(vp.parent)
+                if p is None:
+                    raise JsonVettingError(f"{name} references missing parent {vp.parent}")
                 if name not in p.children:
                     p.children.append(name)
-
-        for name, vp in list(self.by_name.items()):
             for c in vp.children:
-                child = self.by_name[c]
+                child = by_name.get(c)
+                if child is None:
+                    raise JsonVettingError(f"{name} lists missing child {c}")
                 if child.parent is None:
                     child.parent = name
                 elif child.parent != name:
@@ -181,27 +428,35 @@ class VettingProc:
                         f"Conflict: {c} has parent {child.parent} and {name}"
                     )
 
-    def _validate_graph(self):
-        visited = set()
-        visiting = set()
-
-        def dfs(n):
-            if n in visiting:
-                raise JsonVettingError(f"Cycle detected at {n}")
-            if n in visited:
-                return
-            visiting.add(n)
-            for c in self.by_name[n].children:
-                dfs(c)
-            visiting.remove(n)
-            visited.add(n)
-
-        roots = [n for n, vp in self.by_name.items() if vp.parent is None]
+        # Children are final now; tuples iterate cheaper and cannot be
+        # mutated downstream
+        for vp in by_name.values():
+            vp.children = tuple(vp.children)
+
+        roots = [n for n, vp in by_name.items() if vp.parent is None]
         if not roots:
             raise JsonVettingError("No root part found")
 
-        for r in roots:
-            dfs(r)
-
-        if len(visited) != len(self.by_name):
+        # Cycle/reachability check on integer CSR adjacency: the DFS
+        # runs over flat int32 arrays (numba-compiled when available)
+        # instead of Python sets of name strings
+        names = list(by_name)
+        idx = {n: i for i, n in enumerate(names)}
+
+        indptr = np.zeros(len(names) + 1, np.int32)
+        for i, n in enumerate(names):
+            indptr[i + 1] = indptr[i] + len(by_name[n].children)
+        indices = np.empty(int(indptr[-1]), np.int32)
+        pos = 0
+        for n in names:
+            for c in by_name[n].children:
+                indices[pos] = idx[c]
+                pos += 1
+
+        cycle_id, visited_count = _dfs_cycle_check(
+            indptr, indices, np.array([idx[r] for r in roots], np.int32)
+        )
+        if cycle_id >= 0:
+            raise JsonVettingError(f"Cycle detected at {names[cycle_id]}")
+        if visited_count != len(by_name):
             raise JsonVettingError("Unreachable parts exist")
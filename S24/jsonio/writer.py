@@ -2,12 +2,31 @@ import json
 import os
 from typing import List, Dict, Any
 
+from S24.io.uring_writer import write_files_batched
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 def write_json(data: Dict[str, Any], output_path: str) -> str:
     """
     Write full pipeline output (metadata, parts, connections) to disk.
+
+    Serialized in one shot (orjson's C serializer when available) and
+    pushed with a single os.write instead of text-mode json.dump's
+    incremental writes.
     """
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    else:
+        payload = json.dumps(data, indent=2).encode("utf-8")
+
+    fd = os.open(str(output_path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, payload)
+    finally:
+        os.close(fd)
 
     return output_path
 
@@ -23,18 +42,23 @@ def write_json_assets(
     """
     os.makedirs(output_dir, exist_ok=True)
 
-    paths = []
-
-    for part in parts:
-        name = part["name"]
-        file_path = os.path.join(output_dir, f"{name}.json")
-
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(part, f, indent=2)
-
-        paths.append(file_path)
+    # Serialize everything first, then push the whole batch through the
+    # batched writer (io_uring when available) in one submission
+    if orjson is not None:
+        files = {
+            os.path.join(output_dir, f"{part['name']}.json"):
+                orjson.dumps(part, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+            for part in parts
+        }
+    else:
+        files = {
+            os.path.join(output_dir, f"{part['name']}.json"):
+                json.dumps(part, indent=2).encode("utf-8")
+            for part in parts
+        }
+    write_files_batched(files)
 
-    return paths
+    return list(files)
 
 # ----------------------------------------------------------------------------------------------------------------------------------------
 
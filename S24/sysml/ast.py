@@ -2,18 +2,22 @@ from dataclasses import dataclass, field
 from typing import Dict, Optional, Any, List
 
 
-@dataclass
+@dataclass(slots=True)
 class PartNode:
     name: str
     attributes_raw: Dict[str, str] = field(default_factory=dict)
     attributes_val: Dict[str, Any] = field(default_factory=dict)
     children: Dict[str, "PartNode"] = field(default_factory=dict)
 
-    ports: Dict[str, Dict[str, Any]] = field(default_factory=dict)   
-    metadata: Dict[str, Any] = field(default_factory=dict)           
+    ports: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    metadata: Dict[str, Any] = field(default_factory=dict)
 
+    # Set by the parser when a child named *dims is attached, so JSON
+    # emission reaches it directly instead of scanning children
+    dims_child: Optional["PartNode"] = None
 
-@dataclass
+
+@dataclass(slots=True)
 class Model:
     package_name: Optional[str] = None
     parts: Dict[str, PartNode] = field(default_factory=dict)
@@ -1,5 +1,6 @@
 import re
 import ast
+import functools
 from typing import Any, Dict, List, Optional, Union
 
 from S24.sysml.ast import Model, PartNode
@@ -8,66 +9,191 @@ def evaluate_attributes(model: Model, *, max_passes: int = 10) -> None:
     """
     Fill PartNode.attributes_val by:
       1) initializing literals from attributes_raw
-      2) iteratively evaluating numeric expressions using SafeEvaluator
+      2) evaluating numeric expressions in dependency order: references
+         are extracted from each expression's AST, the expressions are
+         topologically sorted, and each is evaluated exactly once with
+         the env updated incrementally. Only cyclic leftovers fall back
+         to the bounded fixpoint loop.
     """
-    def init_literals(part: PartNode) -> None:
+    # One walk does it all: parse literals, publish already-numeric
+    # values into the env under every reference key form, and collect
+    # the still-unresolved expressions with those same key forms. The
+    # env is never rebuilt; resolve() inserts new values incrementally.
+    env: Dict[str, float] = {}
+    evaluator = SafeEvaluator(env)
+
+    pending: List[tuple] = []  # (part, attr, raw, keys)
+    owner: Dict[str, int] = {}  # env key -> index of the pending producer
+
+    def walk(part: PartNode, parent_chain: List[str], parent_name: Optional[str]) -> None:
+        full_prefix = ".".join(parent_chain + [part.name])
         for name, raw in part.attributes_raw.items():
-            part.attributes_val[name] = _parse_literal_token(raw)
+            val = _parse_literal_token(raw)
+            part.attributes_val[name] = val
+
+            keys = [name, f"{part.name}.{name}", f"{full_prefix}.{name}"]
+            if parent_name:
+                keys.append(f"{parent_name}.{part.name}.{name}")
+            keys = tuple(dict.fromkeys(keys))
+
+            if isinstance(val, (int, float)):
+                v = float(val)
+                for k in keys:
+                    env[k] = v
+                continue
+            if raw.strip().startswith('"') and raw.strip().endswith('"'):
+                continue
+
+            idx = len(pending)
+            pending.append((part, name, raw, keys))
+            for k in keys:
+                owner[k] = idx
         for child in part.children.values():
-            init_literals(child)
+            walk(child, parent_chain + [part.name], part.name)
 
     for p in model.parts.values():
-        init_literals(p)
-
+        walk(p, [], None)
+
+    def resolve(idx: int) -> bool:
+        part, name, raw, keys = pending[idx]
+        try:
+            val = evaluator.eval(raw)
+        except Exception as e:
+            print(f"[WARN] Could not evaluate {name}: {raw} → {e}")
+            return False
+        part.attributes_val[name] = val
+        v = float(val)
+        for k in keys:
+            env[k] = v
+        return True
+
+    # Kahn's algorithm over producer edges; expressions whose references
+    # are already in env (or unknowable) start ready
+    dependents: List[set] = [set() for _ in pending]
+    indegree = [0] * len(pending)
+    for i, (_, _, raw, _) in enumerate(pending):
+        try:
+            names = _referenced_names(raw)
+        except Exception:
+            names = ()
+        for nm in names:
+            j = owner.get(nm)
+            if j is not None and j != i and nm not in env and i not in dependents[j]:
+                dependents[j].add(i)
+                indegree[i] += 1
+
+    ready = [i for i, d in enumerate(indegree) if d == 0]
+    done = [False] * len(pending)
+    while ready:
+        i = ready.pop()
+        done[i] = True
+        resolve(i)
+        for j in dependents[i]:
+            indegree[j] -= 1
+            if indegree[j] == 0:
+                ready.append(j)
+
+    # Cyclic (or mutually blocked) leftovers: bounded fixpoint over just
+    # that subset, preserving the old iterative semantics
+    leftovers = [i for i, d in enumerate(done) if not d]
     for _ in range(max_passes):
-        env: Dict[str, float] = {}
-        for p in model.parts.values():
-            env.update(_collect_env(p))
-
+        if not leftovers:
+            break
         changed = False
-        evaluator = SafeEvaluator(env)
+        still = []
+        for i in leftovers:
+            if resolve(i):
+                changed = True
+            else:
+                still.append(i)
+        leftovers = still
+        if not changed:
+            break
+
+#----------------------------------------------------------------------------------------------
+# Helpers
+
+Number = Union[int, float]
 
-        def try_eval(part: PartNode) -> None:
-            nonlocal changed
-            for name, raw in part.attributes_raw.items():
-                current = part.attributes_val.get(name)
 
-                # already numeric
-                if isinstance(current, (int, float)):
-                    continue
+class _DottedNameFolder(ast.NodeTransformer):
+    """
+    Fold Attribute chains (Part.attr, Root.Child.attr) into single Name
+    nodes whose id is the dotted path, so the compiled code object
+    resolves each reference with one env-dict lookup.
+    """
 
-                # quoted string stays string
-                if raw.strip().startswith('"') and raw.strip().endswith('"'):
-                    continue
+    def visit_Attribute(self, node: ast.Attribute) -> ast.Name:
+        parts: List[str] = []
+        cur: ast.AST = node
 
-                # try eval
-                try:
-                    val = evaluator.eval(raw)
-                    part.attributes_val[name] = val
-                    changed = True
-                except Exception as e:
-                    print(f"[WARN] Could not evaluate {name}: {raw} → {e}")
+        while isinstance(cur, ast.Attribute):
+            parts.append(cur.attr)
+            cur = cur.value
 
-            for child in part.children.values():
-                try_eval(child)
+        if not isinstance(cur, ast.Name):
+            raise ValueError(f"Disallowed expression node: {type(cur).__name__}")
+        parts.append(cur.id)
 
-        for p in model.parts.values():
-            try_eval(p)
+        return ast.copy_location(
+            ast.Name(id=".".join(reversed(parts)), ctx=ast.Load()), node
+        )
 
-        if not changed:
-            break
 
-#----------------------------------------------------------------------------------------------
-# Helpers
+def _validate(tree: ast.AST, allowed: tuple) -> None:
+    for node in ast.walk(tree):
+        if not isinstance(node, allowed):
+            raise ValueError(f"Disallowed expression node: {type(node).__name__}")
+        if isinstance(node, ast.Constant) and not isinstance(node.value, (int, float)):
+            raise ValueError("Only numeric constants allowed")
 
-Number = Union[int, float]
-class SafeEvaluator(ast.NodeVisitor):
+
+@functools.lru_cache(maxsize=None)
+def _compile_expr(expr: str) -> Any:
+    """
+    Compile-once cache: parse (^ mapped to **), validate against the
+    allowed node set, fold dotted references, and compile to a code
+    object. Each distinct expression pays this once; every subsequent
+    eval is a single CPython bytecode execution instead of per-node
+    visitor dispatch. compile() lowers the tree to a flat instruction
+    stream and constant-folds reference-free subtrees, so constant
+    arithmetic costs nothing at evaluation time.
+    """
+    tree = ast.parse(expr.replace("^", "**"), mode="eval")
+    _validate(tree, SafeEvaluator.allowed_nodes)
+    tree = _DottedNameFolder().visit(tree)
+    ast.fix_missing_locations(tree)
+    return compile(tree, "<attr>", "eval")
+
+
+@functools.lru_cache(maxsize=None)
+def _referenced_names(expr: str) -> tuple:
+    """
+    Names (bare and dotted) an expression reads, extracted once per
+    distinct expression for dependency ordering in evaluate_attributes.
+    """
+    tree = ast.parse(expr.replace("^", "**"), mode="eval")
+    tree = _DottedNameFolder().visit(tree)
+    return tuple({
+        node.id for node in ast.walk(tree) if isinstance(node, ast.Name)
+    })
+
+
+# Shared globals for compiled-expression eval: builtins stay empty, and
+# allocating the mapping once removes the last per-eval setup cost
+_EVAL_GLOBALS: Dict[str, Any] = {"__builtins__": {}}
+
+
+class SafeEvaluator:
     """
     Safe evaluator for simple arithmetic and attribute references.
     Supports:
       - +, -, *, /, ** (and ^ mapped to **)
-      - unary +/- 
+      - unary +/-
       - Name and Attribute references (e.g. A, Part.attr, Root.Child.attr)
+
+    Expressions are validated once, compiled to code objects, and run
+    with eval() against the env dict and empty builtins.
     """
 
     allowed_nodes = (
@@ -79,65 +205,16 @@ class SafeEvaluator(ast.NodeVisitor):
     def __init__(self, env: Dict[str, Number]) -> None:
         self.env = env
 
-    def visit(self, node: ast.AST) -> Any:
-        if not isinstance(node, self.allowed_nodes):
-            raise ValueError(f"Disallowed expression node: {type(node).__name__}")
-        return super().visit(node)
-
     def eval(self, expr: str) -> Number:
-        expr = expr.replace("^", "**")
-        tree = ast.parse(expr, mode="eval")
-        return self.visit(tree.body)
-
-    def visit_Constant(self, node: ast.Constant) -> Number:
-        if isinstance(node.value, (int, float)):
-            return node.value
-        raise ValueError("Only numeric constants allowed")
-
-    def visit_Name(self, node: ast.Name) -> Number:
-        if node.id in self.env:
-            return self.env[node.id]
-        raise ValueError(f"Unknown variable: {node.id}")
-
-    def visit_Attribute(self, node: ast.Attribute) -> Number:
-        parts: List[str] = []
-        cur: ast.AST = node
+        try:
+            return eval(_compile_expr(expr), _EVAL_GLOBALS, self.env)
+        except NameError as e:
+            name = getattr(e, "name", None) or str(e)
+            if "." in name:
+                raise ValueError(f"Unknown attribute reference: {name}")
+            raise ValueError(f"Unknown variable: {name}")
 
-        while isinstance(cur, ast.Attribute):
-            parts.append(cur.attr)
-            cur = cur.value
 
-        if isinstance(cur, ast.Name):
-            parts.append(cur.id)
-
-        full = ".".join(reversed(parts))
-        if full in self.env:
-            return self.env[full]
-        raise ValueError(f"Unknown attribute reference: {full}")
-
-    def visit_UnaryOp(self, node: ast.UnaryOp) -> Number:
-        val = self.visit(node.operand)
-        if isinstance(node.op, ast.USub):
-            return -val
-        if isinstance(node.op, ast.UAdd):
-            return val
-        raise ValueError("Unsupported unary operator")
-
-    def visit_BinOp(self, node: ast.BinOp) -> Number:
-        l = self.visit(node.left)
-        r = self.visit(node.right)
-        if isinstance(node.op, ast.Add):
-            return l + r
-        if isinstance(node.op, ast.Sub):
-            return l - r
-        if isinstance(node.op, ast.Mult):
-            return l * r
-        if isinstance(node.op, ast.Div):
-            return l / r
-        if isinstance(node.op, ast.Pow):
-            return l ** r
-        raise ValueError("Unsupported binary operator")
-    
 _STR_RE = re.compile(r'"([^"]*)"')
 _NUM_RE = re.compile(r"^-?\d+(\.\d+)?$")
     
@@ -159,47 +236,6 @@ def _parse_literal_token(value_str: str) -> Any:
 
     return s
 
-def _collect_env(part: PartNode, parent_chain: Optional[List[str]] = None) -> Dict[str, float]:
-    """
-    Collect evaluated numeric attributes into env with reference styles:
-      - attrName
-      - PartName.attrName
-      - Parent.Child.PartName.attrName
-      - ChildName.attrName   <-- important for *_dims
-    """
-    if parent_chain is None:
-        parent_chain = []
-
-    env: Dict[str, float] = {}
-
-    full_chain = parent_chain + [part.name]
-    full_prefix = ".".join(full_chain)
-    local_prefix = part.name
-
-    # Current part attributes
-    for name, val in part.attributes_val.items():
-        if isinstance(val, (int, float)):
-            v = float(val)
-
-            env[name] = v
-            env[f"{local_prefix}.{name}"] = v
-            env[f"{full_prefix}.{name}"] = v
-
-    for child_name, child in part.children.items():
-        child_prefix = f"{part.name}.{child_name}"
-
-        for attr_name, val in child.attributes_val.items():
-            if isinstance(val, (int, float)):
-                v = float(val)
-                env[f"{child_name}.{attr_name}"] = v
-                env[f"{child_prefix}.{attr_name}"] = v
-
-    for child in part.children.values():
-        env.update(_collect_env(child, parent_chain=full_chain))
-
-    return env
-
-
 def _print_model_with_values(model: Model):
     '''
     Debug priting def for observing changes and evaluated expressions. PRINT EVALUATED MODEL
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from typing import Any, Dict
+
+from S24.sysml.main_api import sysml_to_json_transformer
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _source_hash(raw: bytes, namespace: str) -> str:
+    """
+    Content hash of the SysML source plus the namespace it is exported
+    under (a namespace change must invalidate the cached JSON too).
+    """
+    h = hashlib.blake2b(raw, digest_size=16)
+    h.update(namespace.encode("utf-8"))
+    return h.hexdigest()
+
+
+def sysml_file_to_json_file(
+    src_path: str,
+    dst_path: str,
+    *,
+    namespace: str = "lunarspaceport1",
+    verbose: int = 0,
+) -> Dict[str, Any]:
+    """
+    Fused SysML-file → JSON-file pipeline: one bytes read, one decode,
+    transform, and a single os.write of the serialized output. Avoids
+    holding separate text/dict/json-string buffers across three call
+    sites. Returns the transformed dict for callers that need it.
+
+    The exported JSON embeds a blake2b hash of the source in its
+    metadata; when the existing output already carries the current hash
+    the transform and write are skipped entirely (steady-state rebuilds
+    do no work on this branch beyond two file reads).
+    """
+    with open(src_path, "rb") as f:
+        raw = f.read()
+
+    src_hash = _source_hash(raw, namespace)
+
+    # The hash lives in the metadata block at the top of the file, so a
+    # short prefix read is enough to detect an up-to-date export.
+    try:
+        with open(dst_path, "rb") as f:
+            head = f.read(4096)
+    except OSError:
+        head = b""
+
+    if src_hash.encode("ascii") in head:
+        with open(dst_path, "rb") as f:
+            existing = f.read()
+        if orjson is not None:
+            return orjson.loads(existing)
+        return json.loads(existing)
+
+    data = sysml_to_json_transformer(verbose, raw.decode("utf-8"), namespace=namespace)
+    data.setdefault("metadata", {})["source_hash"] = src_hash
+
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    else:
+        payload = json.dumps(data, indent=2).encode("utf-8")
+
+    fd = os.open(dst_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, payload)
+    finally:
+        os.close(fd)
+
+    return data
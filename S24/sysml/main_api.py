@@ -1,4 +1,6 @@
 from __future__ import annotations
+import functools
+from collections import deque
 from typing import Any, Dict, List, Optional
 
 from S24.sysml.ast import Model, PartNode
@@ -7,6 +9,18 @@ from S24.sysml.evaluator import evaluate_attributes, _print_model_with_values
 #-----
 from S24.jsonio.json_parser import build_part_json_representation, build_connections_json, validate_connections
 
+@functools.lru_cache(maxsize=4)
+def _compiled_model(sysml_text: str) -> Model:
+    """
+    Parse + evaluate once per distinct source text, so several exports
+    over the same SysML (parts, materials, ...) share one Model. The
+    returned Model is shared between callers and must not be mutated.
+    """
+    model = parse_sysml(sysml_text)
+    evaluate_attributes(model)
+    return model
+
+
 def sysml_to_json_transformer(
     verbose: int,
     sysml_text: str,
@@ -14,10 +28,8 @@ def sysml_to_json_transformer(
     validate: bool = True,
 ) -> Dict[str, Any]:
 
-    # parse the sysml text into a structured python object: Model 
-    model: Model = parse_sysml(sysml_text)
-    # evaluate model's expressions
-    evaluate_attributes(model)
+    # parse + evaluate (cached per distinct source text)
+    model: Model = _compiled_model(sysml_text)
 
     parts: List[Dict[str, Any]] = []
     for top in model.parts.values():
@@ -55,25 +67,31 @@ def _emit_part_recursive(
     namespace: str,
     parent: Optional[PartNode] = None,
 ) -> None:
-
-    obj = build_part_json_representation(part, namespace=namespace)
-
-    if parent is not None:
-        obj["parent"] = parent.name
-
-    child_names = [
-        n for n in part.children.keys()
-        if not n.lower().endswith("dims")
-    ]
-    if child_names:
-        obj["children"] = child_names
-
-    parts.append(obj)
-
-    for child_name, child in part.children.items():
-        if child_name.lower().endswith("dims"):
-            continue
-        _emit_part_recursive(child, parts, namespace=namespace, parent=part)
+    # Explicit-stack pre-order walk: same emit order as the old
+    # recursion (children pushed reversed onto the LIFO stack), without
+    # a Python frame per PartNode
+    stack = deque([(part, parent)])
+    while stack:
+        node, par = stack.pop()
+
+        obj = build_part_json_representation(node, namespace=namespace)
+
+        if par is not None:
+            obj["parent"] = par.name
+
+        child_names = [
+            n for n in node.children.keys()
+            if not n.lower().endswith("dims")
+        ]
+        if child_names:
+            obj["children"] = child_names
+
+        parts.append(obj)
+
+        for child_name, child in reversed(node.children.items()):
+            if child_name.lower().endswith("dims"):
+                continue
+            stack.append((child, node))
 
 # ----------------------------------------------------------------------------------------------------------------------------------------
 
@@ -1,7 +1,16 @@
-import re
 from typing import Any, Dict, List, Optional
 
 from S24.sysml.ast import Model, PartNode
+from S24.sysml.tokens_hs import (
+    TOK_ATTRIBUTE,
+    TOK_INTERFACE,
+    TOK_PACKAGE,
+    TOK_PART,
+    TOK_PORT,
+    TOK_PORT_ITEM,
+    TOK_VIEW,
+    match_line,
+)
 
 def parse_sysml(sysml_text: str) -> Model:
     '''
@@ -20,8 +29,13 @@ def parse_sysml(sysml_text: str) -> Model:
         if not line:
             continue
 
-        m = re.match(r"package\s+(?:'([^']+)'|(\w+))\s*\{", line)
-        if m:
+        # One scan classifies the line against every construct pattern
+        # (Hyperscan when available, compiled re otherwise).
+        hit = match_line(line)
+        kind = hit[0] if hit is not None else None
+        m = hit[1] if hit is not None else None
+
+        if kind == TOK_PACKAGE:
             pkg_name = m.group(1) or m.group(2)
 
             if "Requirement" in pkg_name or "Requirements" in pkg_name:
@@ -42,7 +56,7 @@ def parse_sysml(sysml_text: str) -> Model:
         if line.startswith("private import"):
             continue
 
-        if re.match(r"view\s+", line):
+        if kind == TOK_VIEW:
             continue
 
         if line.startswith("metadata"):
@@ -51,13 +65,14 @@ def parse_sysml(sysml_text: str) -> Model:
                 current_stack[-1].metadata[key] = line
             continue
 
-        m = re.match(r"part\s+(?:def\s+)?(\w+)(?:\s*:\s*\w+)?\s*\{", line)
-        if m:
+        if kind == TOK_PART:
             part_name = m.group(1)
             node = PartNode(name=part_name)
 
             if current_stack:
                 current_stack[-1].children[part_name] = node
+                if part_name.lower().endswith("dims"):
+                    current_stack[-1].dims_child = node
             else:
                 model.parts[part_name] = node
 
@@ -65,8 +80,7 @@ def parse_sysml(sysml_text: str) -> Model:
             brace_stack.append("part")
             continue
 
-        m = re.match(r"port\s+(\w+)\s*\{", line)
-        if m and current_stack:
+        if kind == TOK_PORT and current_stack:
             port_name = m.group(1)
             current_port = {
                 "name": port_name,
@@ -77,11 +91,7 @@ def parse_sysml(sysml_text: str) -> Model:
             brace_stack.append("port")
             continue
 
-        m = re.match(
-            r"interface\s+(\w+)\s*:\s*([\w:]+)\s+connect\s+([\w\.]+)\s+to\s+([\w\.]+);",
-            line
-        )
-        if m:
+        if kind == TOK_INTERFACE:
             iface_name = m.group(1)
             iface_type = m.group(2)
             src = m.group(3)
@@ -118,16 +128,14 @@ def parse_sysml(sysml_text: str) -> Model:
             continue
 
         if current_port:
-            m = re.match(r"(in|out)\s+item\s+(\w+);", line)
-            if m:
+            if kind == TOK_PORT_ITEM:
                 direction, item_name = m.groups()
                 current_port["direction"].append(direction)
                 current_port["items"].append(item_name)
             continue
 
         if current_stack:
-            m = re.match(r"attribute\s+(\w+)\s*=\s*(.+);", line)
-            if m:
+            if kind == TOK_ATTRIBUTE:
                 attr_name = m.group(1)
                 raw_val = m.group(2).strip()
                 current_stack[-1].attributes_raw[attr_name] = raw_val
@@ -0,0 +1,96 @@
+"""
+Line tokenization for the SysML parser.
+
+Classifying a line means testing it against several construct patterns
+(package, part, port, interface, port item, attribute). Hyperscan can do
+that in a single DFA scan and report which pattern hit; when it is not
+installed we fall back to trying the same patterns one by one with the
+stdlib `re` module. Either way the patterns are compiled exactly once at
+import time, and the `re` compilations also serve as the group-capturing
+step (Hyperscan reports match ids only, not capture groups).
+"""
+import re
+from typing import Optional, Tuple
+
+# Token kinds, ordered by the priority the parser tries them in.
+TOK_PACKAGE = 0
+TOK_VIEW = 1
+TOK_PART = 2
+TOK_PORT = 3
+TOK_INTERFACE = 4
+TOK_PORT_ITEM = 5
+TOK_ATTRIBUTE = 6
+
+_RAW_PATTERNS = [
+    (TOK_PACKAGE, r"^package\s+(?:'([^']+)'|(\w+))\s*\{"),
+    (TOK_VIEW, r"^view\s+"),
+    (TOK_PART, r"^part\s+(?:def\s+)?(\w+)(?:\s*:\s*\w+)?\s*\{"),
+    (TOK_PORT, r"^port\s+(\w+)\s*\{"),
+    (
+        TOK_INTERFACE,
+        r"^interface\s+(\w+)\s*:\s*([\w:]+)\s+connect\s+([\w\.]+)\s+to\s+([\w\.]+);",
+    ),
+    (TOK_PORT_ITEM, r"^(in|out)\s+item\s+(\w+);"),
+    (TOK_ATTRIBUTE, r"^attribute\s+(\w+)\s*=\s*(.+);"),
+]
+
+_COMPILED = {kind: re.compile(pattern) for kind, pattern in _RAW_PATTERNS}
+
+# Every pattern is anchored on a fixed leading keyword, so the fallback
+# path can dispatch on the line's first word and run at most one regex
+# instead of trying all seven; non-construct lines run none.
+_BY_KEYWORD = {
+    "package": TOK_PACKAGE,
+    "view": TOK_VIEW,
+    "part": TOK_PART,
+    "port": TOK_PORT,
+    "interface": TOK_INTERFACE,
+    "in": TOK_PORT_ITEM,
+    "out": TOK_PORT_ITEM,
+    "attribute": TOK_ATTRIBUTE,
+}
+
+try:
+    import hyperscan
+
+    _db = hyperscan.Database()
+    _db.compile(
+        expressions=[pattern.encode("utf-8") for _, pattern in _RAW_PATTERNS],
+        ids=[kind for kind, _ in _RAW_PATTERNS],
+        flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(_RAW_PATTERNS),
+    )
+except ImportError:
+    hyperscan = None
+    _db = None
+
+
+def match_line(line: str) -> Optional[Tuple[int, "re.Match"]]:
+    """
+    Classify one (already comment-stripped) line.
+
+    Returns (token_kind, re.Match) for the highest-priority construct the
+    line matches, or None when it matches none of them.
+    """
+    if _db is not None:
+        hits = []
+        _db.scan(
+            line.encode("utf-8"),
+            match_event_handler=lambda pat_id, start, end, flags, ctx: hits.append(pat_id),
+        )
+        for kind in sorted(hits):
+            m = _COMPILED[kind].match(line)
+            if m:
+                return kind, m
+        return None
+
+    i = 0
+    n = len(line)
+    while i < n and line[i].isalpha():
+        i += 1
+    kind = _BY_KEYWORD.get(line[:i])
+    if kind is None:
+        return None
+    m = _COMPILED[kind].match(line)
+    if m:
+        return kind, m
+    return None
@@ -1,6 +1,7 @@
 from __future__ import annotations
+from functools import lru_cache
 from typing import Dict, List, Optional
-from pxr import Usd, UsdGeom, Sdf, Gf
+from pxr import Usd, Sdf, Gf, Vt
 from .utils import set_stage_metadata, ref_path
 import os
 
@@ -55,17 +56,18 @@ def _derive_asset_type_and_role(node_name: str) -> tuple[str, str]:
     return "generic_asset", "assembly_member"
 
 
-def _stamp_generic_metadata(prim, prim_path: Sdf.Path, node_name: str, comp_abs: str) -> None:
-    asset_id = _derive_asset_id(prim_path, node_name)
+def _stamp_generic_metadata(prim_spec: Sdf.PrimSpec, node_name: str, comp_abs: str) -> None:
+    asset_id = _derive_asset_id(prim_spec.path, node_name)
     asset_type, role = _derive_asset_type_and_role(node_name)
     display_name = _derive_display_name(node_name)
 
-    prim.SetCustomDataByKey("s24:name", node_name)
-    prim.SetCustomDataByKey("s24:asset_id", asset_id)
-    prim.SetCustomDataByKey("s24:asset_type", asset_type)
-    prim.SetCustomDataByKey("s24:role", role)
-    prim.SetCustomDataByKey("s24:display_name", display_name)
-    prim.SetCustomDataByKey("s24:source_component", os.path.abspath(comp_abs))
+    custom = prim_spec.customData
+    custom["s24:name"] = node_name
+    custom["s24:asset_id"] = asset_id
+    custom["s24:asset_type"] = asset_type
+    custom["s24:role"] = role
+    custom["s24:display_name"] = display_name
+    custom["s24:source_component"] = os.path.abspath(comp_abs)
 
 
 def author_assembly_scene(
@@ -87,66 +89,112 @@ def author_assembly_scene(
 
     Each placed Xform references the part component layer at /<part_name>.
     """
-    if os.path.exists(scene_path):
-        os.remove(scene_path)
-
-    old_layer = Sdf.Layer.Find(scene_path)
-    if old_layer:
-        old_layer.Clear()
-
-    stage = Usd.Stage.CreateNew(scene_path)
+    # Reuse a cached in-memory layer instead of deleting the file and
+    # recreating the layer; rebuilding the same scene skips the
+    # filesystem round-trip and fresh stage allocation.
+    existing = Sdf.Layer.Find(scene_path)
+    if existing is not None:
+        existing.Clear()
+        stage = Usd.Stage.Open(existing)
+    else:
+        stage = Usd.Stage.CreateNew(scene_path)
     set_stage_metadata(stage, meters_per_unit=meters_per_unit, up_axis=up_axis)
+    layer = stage.GetRootLayer()
 
-    world = UsdGeom.Xform.Define(stage, "/World")
-    stage.SetDefaultPrim(world.GetPrim())
+    # The scene directory never changes and the same component layers are
+    # referenced by many prims, so resolve each absolute path to its
+    # scene-relative form exactly once.
+    scene_dir = os.path.dirname(os.path.abspath(scene_path))
 
-    def add_ref(prim, comp_abs: str, prim_name: str, prim_path: Sdf.Path) -> None:
-        comp_abs_resolved = os.path.abspath(comp_abs)
-        comp_rel = os.path.relpath(
-            comp_abs_resolved, os.path.dirname(os.path.abspath(scene_path))
-        )
-        if debug_refs:
-            print(f"[REF] {prim_path} -> {comp_rel} :/{prim_name}")
-        prim.GetReferences().AddReference(comp_rel, f"/{prim_name}")
+    @lru_cache(maxsize=None)
+    def _rel(abs_path: str) -> str:
+        return os.path.relpath(abs_path, scene_dir)
 
-    def place(node_name: str, parent_path: Sdf.Path) -> None:
-        node = by_name[node_name]
-        prim_path = parent_path.AppendChild(node_name)
-        x = UsdGeom.Xform.Define(stage, prim_path)
-        x.AddTranslateOp().Set(Gf.Vec3d(*node.translate))
-        x.AddRotateXYZOp().Set(Gf.Vec3f(*node.rotation_deg))
-        prim = x.GetPrim()
+    # comp_path_for is repeatedly asked about the same VettedPart when a
+    # part is shared across instances; memoize by object identity.
+    _comp_cache: Dict[int, str] = {}
 
-        comp_abs = comp_path_for(node)
+    def _comp_path(node) -> str:
+        path = _comp_cache.get(id(node))
+        if path is None:
+            path = _comp_cache[id(node)] = comp_path_for(node)
+        return path
 
-        if instanceable:
-            prim.SetInstanceable(True)
+    _XFORM_OP_ORDER = Vt.TokenArray(["xformOp:translate", "xformOp:rotateXYZ"])
 
-        add_ref(prim, comp_abs, node_name, prim_path)
-        _stamp_generic_metadata(prim, prim_path, node_name, comp_abs)
+    def _author_xform(parent_spec: Sdf.PrimSpec, name: str, node, *, add_reference: bool) -> Sdf.PrimSpec:
+        # Pure Sdf authoring: spec creation skips schema validation and
+        # per-op stage round-trips that UsdGeom.Xform.Define + AddXxxOp
+        # would pay for every prim.
+        spec = Sdf.PrimSpec(parent_spec, name, Sdf.SpecifierDef, "Xform")
 
-        for ch in node.children:
-            place(ch, prim_path)
+        t = Sdf.AttributeSpec(spec, "xformOp:translate", Sdf.ValueTypeNames.Double3)
+        t.default = Gf.Vec3d(*node.translate)
+        r = Sdf.AttributeSpec(spec, "xformOp:rotateXYZ", Sdf.ValueTypeNames.Float3)
+        r.default = Gf.Vec3f(*node.rotation_deg)
+        order = Sdf.AttributeSpec(spec, "xformOpOrder", Sdf.ValueTypeNames.TokenArray)
+        order.default = _XFORM_OP_ORDER
 
-    for rn in root_names:
-        root_part = by_name[rn]
-        root_path = Sdf.Path(f"/World/{rn}")
-        root_xf = UsdGeom.Xform.Define(stage, root_path)
-        root_xf.AddTranslateOp().Set(Gf.Vec3d(*root_part.translate))
-        root_xf.AddRotateXYZOp().Set(Gf.Vec3f(*root_part.rotation_deg))
+        comp_abs = _comp_path(node)
 
-        prim = root_xf.GetPrim()
-        comp_abs = comp_path_for(root_part)
-
-        if include_root_as_instance:
+        if add_reference:
             if instanceable:
-                prim.SetInstanceable(True)
-            add_ref(prim, comp_abs, rn, root_path)
-
-        _stamp_generic_metadata(prim, root_path, rn, comp_abs)
+                spec.instanceable = True
+            comp_rel = _rel(os.path.abspath(comp_abs))
+            if debug_refs:
+                print(f"[REF] {spec.path} -> {comp_rel} :/{name}")
+            spec.referenceList.prependedItems.append(
+                Sdf.Reference(comp_rel, Sdf.Path(f"/{name}"))
+            )
+
+        _stamp_generic_metadata(spec, name, comp_abs)
+        return spec
+
+    def place_subtree(parent_part, parent_spec: Sdf.PrimSpec) -> None:
+        # Explicit-stack pre-order walk: children pushed reversed keep
+        # the recursive authoring order without a Python frame per node.
+        work = [(ch, parent_spec) for ch in reversed(parent_part.children)]
+        while work:
+            node_name, par_spec = work.pop()
+            node = by_name[node_name]
+            spec = _author_xform(par_spec, node_name, node, add_reference=True)
+            work.extend((ch, spec) for ch in reversed(node.children))
+
+    # One change block coalesces the notification cascade for the whole
+    # tree; the stage recomposes once when the block closes.
+    with Sdf.ChangeBlock():
+        world_spec = Sdf.PrimSpec(layer, "World", Sdf.SpecifierDef, "Xform")
+        layer.defaultPrim = "World"
+
+        for rn in root_names:
+            root_part = by_name[rn]
+            root_spec = _author_xform(
+                world_spec, rn, root_part,
+                add_reference=include_root_as_instance,
+            )
+            place_subtree(root_part, root_spec)
+
+    layer.Save()
+    return scene_path
 
-        for ch in root_part.children:
-            place(ch, root_path)
 
-    stage.GetRootLayer().Save()
-    return scene_path
+def author_crate_wrapper(crate_path: str, wrapper_path: str) -> str:
+    """
+    Author a thin .usda entry layer that sublayers a binary .usdc scene,
+    so the crate stays inspectable from a text editor / usdview default.
+    """
+    layer = Sdf.Layer.Find(wrapper_path)
+    if layer is not None:
+        layer.Clear()
+    else:
+        layer = Sdf.Layer.CreateNew(wrapper_path)
+    layer.subLayerPaths.append(
+        os.path.relpath(
+            os.path.abspath(crate_path),
+            os.path.dirname(os.path.abspath(wrapper_path)),
+        )
+    )
+    layer.defaultPrim = "World"
+    layer.comment = "Entry layer; scene content lives in the binary crate sublayer."
+    layer.Save()
+    return wrapper_path
@@ -1,15 +1,36 @@
 from __future__ import annotations
 
+import hashlib
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional
 
 from S24.jsonio.vetting import VettedPart
 
 from .utils import ensure_can_write
-from .geometry import author_box_geom_layer
+from .geometry import author_box_geom_layer, author_box_template_layer
 from .materials import author_preview_material_layer
 from .components import author_component_layer
-from .assembly import author_assembly_scene
+from .assembly import author_assembly_scene, author_crate_wrapper
+
+
+def _content_key(*fields) -> str:
+    """Short digest over the inputs that determine a layer's content."""
+    return hashlib.blake2b(repr(fields).encode(), digest_size=8).hexdigest()
+
+
+def _is_current(path: str, key: str) -> bool:
+    """True when path exists and its .hash sidecar matches key."""
+    try:
+        with open(path + ".hash", "r", encoding="utf-8") as f:
+            return f.read() == key and os.path.exists(path)
+    except OSError:
+        return False
+
+
+def _record_key(path: str, key: str) -> None:
+    with open(path + ".hash", "w", encoding="utf-8") as f:
+        f.write(key)
 
 
 class USDBuilder:
@@ -53,18 +74,39 @@ class USDBuilder:
         os.makedirs(self.comps_dir, exist_ok=True)
         os.makedirs(self.scenes_dir, exist_ok=True)
 
+        # Shared box topology, authored once; per-part geom layers
+        # reference it and override only points/extent
+        self.box_template_path = author_box_template_layer(
+            os.path.join(self.geoms_dir, "_box_template.usda")
+        )
+
+        # Preview material layers by (metersPerUnit, upAxis): all parts
+        # use the default preview params, so one layer serves them all
+        self._shared_mat_cache: Dict[tuple, str] = {}
+
+        # Asset paths per part, joined/formatted once instead of on
+        # every *_path_for call during the build fan-out
+        self._paths = {
+            n: (
+                os.path.join(self.geoms_dir, f"{n}_geom.usda"),
+                os.path.join(self.mats_dir, f"{n}_mat.usda"),
+                os.path.join(self.comps_dir, f"{n}.usda"),
+            )
+            for n in by_name
+        }
+
     def geom_path_for(self, vp: VettedPart) -> str:
         if self.use_paths_from_vetted:
             return vp.geom_path
-        return os.path.join(self.geoms_dir, f"{vp.name}_geom.usda")
+        return self._paths[vp.name][0]
 
     def mat_path_for(self, vp: VettedPart) -> str:
         if self.use_paths_from_vetted:
             return vp.material_path
-        return os.path.join(self.mats_dir, f"{vp.name}_mat.usda")
+        return self._paths[vp.name][1]
 
     def comp_path_for(self, vp: VettedPart) -> str:
-        return os.path.join(self.comps_dir, f"{vp.name}.usda")
+        return self._paths[vp.name][2]
 
     def material_name_for(self, vp: VettedPart) -> str:
         return f"{vp.name}_Material"
@@ -73,23 +115,57 @@ class USDBuilder:
         geom_path = self.geom_path_for(vp)
         ensure_can_write(geom_path, overwrite=self.overwrite)
         prim_name = f"{vp.name}_Geom"
-        return author_box_geom_layer(
+
+        # Incremental rebuilds: skip authoring when the inputs that shape
+        # this layer are unchanged since the last write
+        key = _content_key(
+            prim_name, vp.dims_m, vp.meters_per_unit, vp.up_axis,
+            self.box_template_path,
+        )
+        if _is_current(geom_path, key):
+            return geom_path
+
+        author_box_geom_layer(
             geom_path=geom_path,
             prim_name=prim_name,
             dims_m=vp.dims_m,
             meters_per_unit=vp.meters_per_unit,
             up_axis=vp.up_axis,
+            template_path=self.box_template_path,
         )
+        _record_key(geom_path, key)
+        return geom_path
 
     def build_material(self, vp: VettedPart) -> str:
-        mat_path = self.mat_path_for(vp)
-        ensure_can_write(mat_path, overwrite=self.overwrite)
-        return author_preview_material_layer(
-            mat_path=mat_path,
-            material_name=self.material_name_for(vp),
-            meters_per_unit=vp.meters_per_unit,
-            up_axis=vp.up_axis,
-        )
+        if self.use_paths_from_vetted:
+            # Vetted JSON pins a per-part path; keep the per-part layer
+            mat_path = self.mat_path_for(vp)
+            ensure_can_write(mat_path, overwrite=self.overwrite)
+            return author_preview_material_layer(
+                mat_path=mat_path,
+                material_name=self.material_name_for(vp),
+                meters_per_unit=vp.meters_per_unit,
+                up_axis=vp.up_axis,
+            )
+
+        key = (float(vp.meters_per_unit), str(vp.up_axis))
+        cached = self._shared_mat_cache.get(key)
+        if cached is None:
+            mat_path = os.path.join(
+                self.mats_dir, f"shared_{key[0]:g}_{key[1]}_mat.usda"
+            )
+            ensure_can_write(mat_path, overwrite=self.overwrite)
+            ck = _content_key("SharedPreview_Material", key)
+            if not _is_current(mat_path, ck):
+                author_preview_material_layer(
+                    mat_path=mat_path,
+                    material_name="SharedPreview_Material",
+                    meters_per_unit=key[0],
+                    up_axis=key[1],
+                )
+                _record_key(mat_path, ck)
+            cached = self._shared_mat_cache[key] = mat_path
+        return cached
 
     def build_component(self, vp: VettedPart, *, geom_path: str) -> str:
         comp_path = self.comp_path_for(vp)
@@ -98,9 +174,17 @@ class USDBuilder:
         geom_prim_path = f"/{vp.name}_Geom"
         material_prim_path = f"/Materials/{vp.material_ref}"
 
-        raw_attrs = vp.raw.get("attributes", {})
+        raw_attrs = vp.raw.get("attributes", {}) if vp.raw else {}
+
+        key = _content_key(
+            vp.name, vp.uid, vp.ptype, vp.dims_m, vp.meters_per_unit,
+            vp.up_axis, sorted(raw_attrs.items()), geom_path,
+            geom_prim_path, self.material_library_path, material_prim_path,
+        )
+        if _is_current(comp_path, key):
+            return comp_path
 
-        return author_component_layer(
+        author_component_layer(
             comp_path=comp_path,
             part_name=vp.name,
             uid=vp.uid,
@@ -114,14 +198,33 @@ class USDBuilder:
             mat_layer_path=self.material_library_path,
             material_prim_path=material_prim_path,
         )
+        _record_key(comp_path, key)
+        return comp_path
 
-    def build_all_parts(self) -> Dict[str, Dict[str, str]]:
-        outputs: Dict[str, Dict[str, str]] = {}
-        for name, vp in self.by_name.items():
+    def build_all_parts(self, max_workers: Optional[int] = None) -> Dict[str, Dict[str, str]]:
+        """
+        Author geometry and component layers for every part.
+
+        Each part writes its own independent files, so the fan-out runs on
+        a thread pool: USD layer serialization is mostly file IO that
+        overlaps well across parts. Pass max_workers=1 to force serial.
+        """
+        def _build_one(vp: VettedPart):
+            # Component references the geom layer, so each part's pair
+            # stays ordered inside one task; parts fan out across threads.
             geom = self.build_geometry(vp)
             comp = self.build_component(vp, geom_path=geom)
-            outputs[name] = {"geom": geom, "component": comp}
-        return outputs
+            return vp.name, {"geom": geom, "component": comp}
+
+        if max_workers is None:
+            # IO-bound: oversubscribe cores, capped like stdlib defaults
+            max_workers = min(32, (os.cpu_count() or 1) * 2)
+
+        if max_workers == 1 or len(self.by_name) <= 1:
+            return dict(_build_one(vp) for vp in self.by_name.values())
+
+        with ThreadPoolExecutor(max_workers=max_workers) as ex:
+            return dict(ex.map(_build_one, self.by_name.values()))
 
     def write_assembly_scene(
         self,
@@ -132,13 +235,24 @@ class USDBuilder:
         include_root_as_instance: bool = True,
         instanceable: bool = False,
         debug_refs: bool = False,
+        scene_format: str = "usda",
     ) -> str:
         """
         Write assembly scene with one or multiple roots into a single USD file.
 
         Use root_names=[...] for multi-root, or root_name="X" for single root
         (backward compatible).
+
+        scene_format="usdc" serializes the scene as a binary Crate file
+        (smaller and much faster to write/load than ASCII) plus a thin
+        .usda entry layer that sublayers it for human inspection.
         """
+        if scene_format not in ("usda", "usdc"):
+            raise ValueError(f"Unknown scene format '{scene_format}' (expected usda/usdc).")
+
+        if scene_format == "usdc":
+            scene_name = os.path.splitext(scene_name)[0] + ".usdc"
+
         ensure_can_write(self.scenes_dir, overwrite=True)
 
         # --- Resolve roots list ---
@@ -147,8 +261,8 @@ class USDBuilder:
         elif root_name is not None:
             roots = [root_name]
         else:
-            # Auto-detect: parts with no parent
-            roots = [n for n, vp in self.by_name.items() if vp.parent is None]
+            # Auto-detect: parts with no parent (sorted for stable output)
+            roots = sorted(n for n, vp in self.by_name.items() if vp.parent is None)
             if not roots:
                 raise ValueError("No root found.")
 
@@ -157,7 +271,7 @@ class USDBuilder:
         scene_path = os.path.join(self.scenes_dir, scene_name)
         ensure_can_write(scene_path, overwrite=self.overwrite)
 
-        return author_assembly_scene(
+        scene_path = author_assembly_scene(
             scene_path=scene_path,
             root_names=roots,
             by_name=self.by_name,
@@ -168,3 +282,10 @@ class USDBuilder:
             instanceable=instanceable,
             debug_refs=debug_refs,
         )
+
+        if scene_format == "usdc":
+            wrapper_path = os.path.splitext(scene_path)[0] + ".usda"
+            ensure_can_write(wrapper_path, overwrite=self.overwrite)
+            author_crate_wrapper(scene_path, wrapper_path)
+
+        return scene_path
@@ -30,6 +30,9 @@ def author_component_layer(
       - binds material to geom if resolvable
     Returns written comp_path.
     """
+    # Stays on-disk (unlike the geom/mat authors): the material binding
+    # below composes mat_ref, a path relative to comp_path, which an
+    # anonymous in-memory layer could not resolve.
     stage = Usd.Stage.CreateNew(comp_path)
     set_stage_metadata(stage, meters_per_unit=meters_per_unit, up_axis=up_axis)
 
@@ -48,12 +51,24 @@ def author_component_layer(
     root_prim.CreateAttribute("spatial:metersPerUnit", Sdf.ValueTypeNames.Double).Set(float(meters_per_unit))
     root_prim.CreateAttribute("spatial:upAxis", Sdf.ValueTypeNames.String).Set(str(up_axis))
 
-    # Raw numeric/string attrs
-    for k, v in raw_attributes.items():
-        if isinstance(v, (int, float)):
-            root_prim.CreateAttribute(f"attr:{k}", Sdf.ValueTypeNames.Double).Set(float(v))
-        else:
-            root_prim.CreateAttribute(f"attr:{k}", Sdf.ValueTypeNames.String).Set(str(v))
+    # Raw numeric/string attrs: authored as Sdf specs inside one change
+    # block so K attributes raise one notification instead of 2K
+    # create/set round-trips; same typed custom attr:* output
+    root_spec = stage.GetRootLayer().GetPrimAtPath(root_prim.GetPath())
+    with Sdf.ChangeBlock():
+        for k, v in raw_attributes.items():
+            if isinstance(v, (int, float)):
+                spec = Sdf.AttributeSpec(
+                    root_spec, f"attr:{k}", Sdf.ValueTypeNames.Double,
+                    declaresCustom=True,
+                )
+                spec.default = float(v)
+            else:
+                spec = Sdf.AttributeSpec(
+                    root_spec, f"attr:{k}", Sdf.ValueTypeNames.String,
+                    declaresCustom=True,
+                )
+                spec.default = str(v)
 
     # Relative refs
     geom_ref = ref_path(geom_layer_path, comp_path)
@@ -1,41 +1,76 @@
 from __future__ import annotations
 
-from typing import Tuple, List
+import os
+from typing import Optional, Tuple
 
-from pxr import Usd, UsdGeom, Gf
+import numpy as np
+from pxr import Usd, UsdGeom, Vt
 
+# Box topology is shared by every part; only the corner coordinates vary
+_CORNER_SIGNS = np.array(
+    [
+        [-1, -1, -1],
+        [+1, -1, -1],
+        [+1, +1, -1],
+        [-1, +1, -1],
+        [-1, -1, +1],
+        [+1, -1, +1],
+        [+1, +1, +1],
+        [-1, +1, +1],
+    ],
+    dtype=np.float32,
+)
 
-def make_box_mesh(dims_m: Tuple[float, float, float]):
-    """
-    Make a simple box mesh centered at origin.
-    Returns: (points, face_counts, face_indices, extent)
-    """
-    L, W, H = float(dims_m[0]), float(dims_m[1]), float(dims_m[2])
-    hx, hy, hz = L / 2.0, W / 2.0, H / 2.0
-
-    points = [
-        Gf.Vec3f(-hx, -hy, -hz),
-        Gf.Vec3f(+hx, -hy, -hz),
-        Gf.Vec3f(+hx, +hy, -hz),
-        Gf.Vec3f(-hx, +hy, -hz),
-        Gf.Vec3f(-hx, -hy, +hz),
-        Gf.Vec3f(+hx, -hy, +hz),
-        Gf.Vec3f(+hx, +hy, +hz),
-        Gf.Vec3f(-hx, +hy, +hz),
-    ]
-
-    face_counts: List[int] = [4, 4, 4, 4, 4, 4]
-    face_indices: List[int] = [
+_FACE_COUNTS = Vt.IntArray.FromNumpy(np.full(6, 4, dtype=np.int32))
+_FACE_INDICES = Vt.IntArray.FromNumpy(np.array(
+    [
         0, 1, 2, 3,   # bottom
         4, 5, 6, 7,   # top
         0, 1, 5, 4,   # -y
         3, 2, 6, 7,   # +y
         0, 3, 7, 4,   # -x
         1, 2, 6, 5,   # +x
-    ]
+    ],
+    dtype=np.int32,
+))
+
 
-    extent = [Gf.Vec3f(-hx, -hy, -hz), Gf.Vec3f(+hx, +hy, +hz)]
-    return points, face_counts, face_indices, extent
+def make_box_mesh(dims_m: Tuple[float, float, float]):
+    """
+    Make a simple box mesh centered at origin.
+    Returns: (points, face_counts, face_indices, extent)
+
+    Points and extent are Vt arrays filled from numpy buffers, so no
+    per-corner Gf.Vec3f objects are boxed on the Python side.
+    """
+    half = np.array(dims_m, dtype=np.float32) / 2.0
+
+    points = Vt.Vec3fArray.FromNumpy(_CORNER_SIGNS * half)
+    extent = Vt.Vec3fArray.FromNumpy(np.stack((-half, half)))
+    return points, _FACE_COUNTS, _FACE_INDICES, extent
+
+
+def author_box_template_layer(template_path: str) -> str:
+    """
+    Author the shared box topology (face counts, indices, subdivision
+    scheme) once at /BoxTemplate. Per-part geom layers reference this
+    and override only points/extent, so the O(parts) layers stay tiny.
+    Skips writing if the template already exists.
+    """
+    if os.path.exists(template_path):
+        return template_path
+
+    stage = Usd.Stage.CreateInMemory()
+
+    mesh = UsdGeom.Mesh.Define(stage, "/BoxTemplate")
+    mesh.CreateFaceVertexCountsAttr(_FACE_COUNTS)
+    mesh.CreateFaceVertexIndicesAttr(_FACE_INDICES)
+    mesh.CreateSubdivisionSchemeAttr(UsdGeom.Tokens.none)
+
+    stage.SetDefaultPrim(mesh.GetPrim())
+    from .utils import export_layer_text
+    export_layer_text(stage.GetRootLayer(), template_path)
+    return template_path
 
 
 def author_box_geom_layer(
@@ -45,25 +80,36 @@ def author_box_geom_layer(
     dims_m: Tuple[float, float, float],
     meters_per_unit: float,
     up_axis: str,
+    template_path: Optional[str] = None,
 ) -> str:
     """
     Create a geometry layer that defines a single Mesh at /<prim_name>.
-    Returns the written geom_path.
+    When template_path is given the mesh references the shared topology
+    template and authors only points/extent. Returns the written
+    geom_path.
     """
-    stage = Usd.Stage.CreateNew(geom_path)
+    # Author in memory and Export once: no on-disk layer is opened up
+    # front and no handle lingers in the global layer registry, which
+    # also keeps concurrent part builds from contending on it.
+    stage = Usd.Stage.CreateInMemory()
 
-    from .utils import set_stage_metadata
+    from .utils import set_stage_metadata, ref_path, export_layer_text
     set_stage_metadata(stage, meters_per_unit=meters_per_unit, up_axis=up_axis)
 
     pts, counts, indices, extent = make_box_mesh(dims_m)
 
     mesh = UsdGeom.Mesh.Define(stage, f"/{prim_name}")
+    if template_path is not None:
+        mesh.GetPrim().GetReferences().AddReference(
+            ref_path(template_path, geom_path), "/BoxTemplate"
+        )
+    else:
+        mesh.CreateFaceVertexCountsAttr(counts)
+        mesh.CreateFaceVertexIndicesAttr(indices)
+        mesh.CreateSubdivisionSchemeAttr(UsdGeom.Tokens.none)
     mesh.CreatePointsAttr(pts)
-    mesh.CreateFaceVertexCountsAttr(counts)
-    mesh.CreateFaceVertexIndicesAttr(indices)
-    mesh.CreateSubdivisionSchemeAttr(UsdGeom.Tokens.none)
     mesh.CreateExtentAttr(extent)
 
     stage.SetDefaultPrim(mesh.GetPrim())
-    stage.GetRootLayer().Save()
+    export_layer_text(stage.GetRootLayer(), geom_path)
     return geom_path
@@ -1,33 +1,79 @@
 from __future__ import annotations
 import json
 import os
-from pxr import Usd, UsdShade, Sdf
+from concurrent.futures import ThreadPoolExecutor
+from pxr import Sdf
+
+from .utils import export_layer_text
+
+try:
+    # C-level parser, same optional dependency the jsonio modules use
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    orjson = None
+    _loads = json.loads
+
+# Below this many materials the thread fan-out costs more than it saves;
+# the shipped libraries are tiny, so they take the serial path.
+_PARALLEL_THRESHOLD = 256
+
+
+def _author_material_spec(scope_spec: Sdf.PrimSpec, mat: dict) -> None:
+    mat_prim = Sdf.PrimSpec(
+        scope_spec, mat["materialId"], Sdf.SpecifierDef, "Material"
+    )
+    # One customData assignment per material: each SetCustomDataByKey
+    # round-trips the whole customData dict through C++
+    custom = {
+        key: (float(value) if isinstance(value, (int, float)) else value)
+        for key, value in mat.items()
+        if key != "materialId" and isinstance(value, (int, float, str))
+    }
+    if custom:
+        mat_prim.customData.update(custom)
+
+
+def _author_chunk_layer(materials: list) -> Sdf.Layer:
+    layer = Sdf.Layer.CreateAnonymous(".usda")
+    scope = Sdf.PrimSpec(layer, "Materials", Sdf.SpecifierDef, "Scope")
+    for mat in materials:
+        _author_material_spec(scope, mat)
+    return layer
+
 
 def generate_material_library(materials_json_path: str, output_usda_path: str) -> str:
-    with open(materials_json_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    with open(materials_json_path, "rb") as f:
+        data = _loads(f.read())
 
     materials = data.get("materials", [])
 
     # Work in memory to avoid USD layer cache issues
-    stage = Usd.Stage.CreateInMemory()
-    stage.SetMetadata("defaultPrim", "Materials")
+    layer = Sdf.Layer.CreateAnonymous(".usda")
+    layer.defaultPrim = "Materials"
+    scope = Sdf.PrimSpec(layer, "Materials", Sdf.SpecifierDef, "Scope")
 
-    scope = stage.DefinePrim("/Materials", "Scope")
+    if len(materials) < _PARALLEL_THRESHOLD:
+        with Sdf.ChangeBlock():
+            for mat in materials:
+                _author_material_spec(scope, mat)
+    else:
+        # Large libraries: author chunks into anonymous layers on a
+        # thread pool (Sdf spec authoring releases the GIL), then stitch
+        # the chunk prims into the output layer in order.
+        workers = min(os.cpu_count() or 1, 8)
+        step = -(-len(materials) // workers)
+        chunks = [materials[i:i + step] for i in range(0, len(materials), step)]
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            chunk_layers = list(ex.map(_author_chunk_layer, chunks))
+        with Sdf.ChangeBlock():
+            for chunk_layer in chunk_layers:
+                for child in chunk_layer.GetPrimAtPath("/Materials").nameChildren:
+                    Sdf.CopySpec(
+                        chunk_layer, child.path,
+                        layer, scope.path.AppendChild(child.name),
+                    )
 
-    for mat in materials:
-        mat_id = mat["materialId"]
-        prim_path = f"/Materials/{mat_id}"
-        mat_prim = UsdShade.Material.Define(stage, prim_path).GetPrim()
-
-        for key, value in mat.items():
-            if key == "materialId":
-                continue
-            if isinstance(value, (int, float)):
-                mat_prim.SetCustomDataByKey(key, float(value))
-            elif isinstance(value, str):
-                mat_prim.SetCustomDataByKey(key, value)
-
-    # Export to file (overwrites safely)
-    stage.GetRootLayer().Export(output_usda_path)
-    return output_usda_path
\ No newline at end of file
+    # Export to file (overwrites safely), one write syscall
+    export_layer_text(layer, output_usda_path)
+    return output_usda_path
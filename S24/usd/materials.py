@@ -18,9 +18,10 @@ def author_preview_material_layer(
       /Materials/<material_name>
     Returns written mat_path.
     """
-    stage = Usd.Stage.CreateNew(mat_path)
+    # In-memory authoring + Export, matching the other layer authors
+    stage = Usd.Stage.CreateInMemory()
 
-    from .utils import set_stage_metadata
+    from .utils import set_stage_metadata, export_layer_text
     set_stage_metadata(stage, meters_per_unit=meters_per_unit, up_axis=up_axis)
 
     mat_prim_path = Sdf.Path(f"/Materials/{material_name}")
@@ -35,5 +36,5 @@ def author_preview_material_layer(
     material.CreateSurfaceOutput().ConnectToSource(shader.ConnectableAPI(), "surface")
 
     stage.SetDefaultPrim(material.GetPrim())
-    stage.GetRootLayer().Save()
+    export_layer_text(stage.GetRootLayer(), mat_path)
     return mat_path
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import os
 from typing import Tuple
 
@@ -15,6 +16,19 @@ def set_stage_metadata(stage: Usd.Stage, *, meters_per_unit: float, up_axis: str
     UsdGeom.SetStageUpAxis(stage, UsdGeom.Tokens.z if up == "Z" else UsdGeom.Tokens.y)
 
 
+def export_layer_text(layer, path: str) -> None:
+    """
+    Serialize a layer to its text form once and write it with a single
+    os.write, instead of the many small writes Export/Save issue.
+    """
+    data = layer.ExportToString().encode("utf-8")
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
 def ensure_can_write(path: str, *, overwrite: bool) -> None:
     """
     Ensure parent directory exists. If overwrite=False and file exists, raise.
@@ -26,26 +40,44 @@ def ensure_can_write(path: str, *, overwrite: bool) -> None:
         raise FileExistsError(f"File exists and overwrite=False: {path}")
 
 
+# Batch builds resolve the same handful of targets against the same
+# layer directories for every part; both normalization steps hit
+# os.getcwd(), so memoize them. Safe because the pipeline never changes
+# the working directory mid-build.
+_abspath = functools.lru_cache(maxsize=None)(os.path.abspath)
+
+
+@functools.lru_cache(maxsize=None)
+def _relpath(abs_target: str, base_dir: str) -> str:
+    return os.path.relpath(abs_target, start=base_dir)
+
+
 def ref_path(target_path: str, authored_layer_path: str) -> str:
     """
     Return a path to target_path relative to authored_layer_path directory.
     Keeps USD references stable regardless of working directory.
     """
-    base_dir = os.path.dirname(os.path.abspath(authored_layer_path))
-    return os.path.relpath(os.path.abspath(target_path), start=base_dir)
+    base_dir = os.path.dirname(_abspath(authored_layer_path))
+    return _relpath(_abspath(target_path), base_dir)
+
+
+# Maps every non-alnum ASCII char to "_"; alnum/underscore pass through
+_SANITIZE_TABLE = str.maketrans({
+    c: "_" for c in map(chr, range(128)) if not (c.isalnum() or c == "_")
+})
 
 
 def sanitize_usd_name(name: str) -> str:
     """
     Minimal name sanitizer for prim names (USD is strict).
     """
-    out = []
-    for ch in name:
-        if ch.isalnum() or ch == "_":
-            out.append(ch)
-        else:
-            out.append("_")
-    s = "".join(out)
+    if name.isascii():
+        # Single C-level scan instead of a per-char Python loop
+        s = name.translate(_SANITIZE_TABLE)
+    else:
+        s = "".join(
+            ch if ch.isalnum() or ch == "_" else "_" for ch in name
+        )
     if not s:
         return "Prim"
     if s[0].isdigit():
@@ -36,6 +36,19 @@ import ast
 from dataclasses import dataclass, field
 from typing import Dict, Optional, Any, List, Union
 
+try:
+    # C encoder for the CLI's output file; without it the stdlib
+    # encoder produces the same 2-space-indented text
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    orjson = None
+
+    def _dumps(obj) -> str:
+        return json.dumps(obj, indent=2)
+
 
 # ----------------------------
 # Data structures
@@ -47,6 +60,9 @@ class PartNode:
     attributes_raw: Dict[str, str] = field(default_factory=dict)
     attributes_val: Dict[str, Any] = field(default_factory=dict)
     children: Dict[str, "PartNode"] = field(default_factory=dict)
+    # First child whose name ends with "dims", noted during parse so
+    # later passes don't rescan children looking for it
+    dims_child: Optional["PartNode"] = None
 
 
 @dataclass
@@ -62,9 +78,15 @@ class Model:
 _str_re = re.compile(r'"([^"]*)"')
 _num_re = re.compile(r'^-?\d+(\.\d+)?$')
 
+# Lines are classified by str.startswith on the leading keyword and
+# picked apart with find/partition — all C-level string ops, no regex
+# engine startup per line. _str_re/_num_re stay for literal parsing.
+
 
 def _strip_comment(line: str) -> str:
-    return line.split("//", 1)[0].rstrip()
+    # Single find() scan; most lines carry no comment and just rstrip
+    i = line.find("//")
+    return line.rstrip() if i < 0 else line[:i].rstrip()
 
 
 def _parse_literal_token(value_str: str) -> Any:
@@ -100,34 +122,50 @@ def parse_sysml(text: str) -> Model:
         if not line:
             continue
 
-        # package
-        m = re.match(r"package\s+'([^']+)'\s*\{", line)
-        if m:
-            model.package_name = m.group(1)
-            brace_stack.append("package")
-            continue
+        # package 'Name' {
+        if line.startswith("package "):
+            i = line.find("'")
+            j = line.find("'", i + 1)
+            if i != -1 and j != -1 and line[j + 1:].lstrip().startswith("{"):
+                model.package_name = line[i + 1:j]
+                brace_stack.append("package")
+                continue
 
         # ignore requirement blocks
-        if re.match(r"requirement\s+\w+\s*\{", line):
-            brace_stack.append("ignore_req")
-            continue
+        elif line.startswith("requirement "):
+            if "{" in line:
+                brace_stack.append("ignore_req")
+                continue
 
         # ignore satisfy statements
-        if re.match(r"satisfy\s+\w+\s+by\s+\w+;", line):
+        elif line.startswith("satisfy "):
             continue
 
         # part (top-level or nested)
-        m = re.match(r"part\s+(\w+)\s*\{", line)
-        if m:
-            part_name = m.group(1)
-            node = PartNode(name=part_name)
-            if current_stack:
-                current_stack[-1].children[part_name] = node
-            else:
-                model.parts[part_name] = node
-            current_stack.append(node)
-            brace_stack.append("part")
-            continue
+        elif line.startswith("part "):
+            brace = line.find("{")
+            if brace != -1:
+                part_name = line[5:brace].strip()
+                if part_name.isidentifier():
+                    node = PartNode(name=part_name)
+                    if current_stack:
+                        parent = current_stack[-1]
+                        parent.children[part_name] = node
+                        if parent.dims_child is None and part_name.lower().endswith("dims"):
+                            parent.dims_child = node
+                    else:
+                        model.parts[part_name] = node
+                    current_stack.append(node)
+                    brace_stack.append("part")
+                    continue
+
+        # attribute name = value;
+        elif line.startswith("attribute ") and current_stack:
+            name_part, eq, raw_val = line[10:].partition("=")
+            attr_name = name_part.strip()
+            if eq and ";" in raw_val and attr_name.isidentifier():
+                current_stack[-1].attributes_raw[attr_name] = raw_val.strip().rstrip(";")
+                continue
 
         # closing brace
         if line == "}":
@@ -137,15 +175,6 @@ def parse_sysml(text: str) -> Model:
                     current_stack.pop()
             continue
 
-        # attributes
-        if current_stack:
-            m = re.match(r"attribute\s+(\w+)\s*=\s*(.+);", line)
-            if m:
-                attr_name = m.group(1)
-                raw_val = m.group(2).strip().rstrip(";")
-                current_stack[-1].attributes_raw[attr_name] = raw_val
-                continue
-
     return model
 
 
@@ -153,7 +182,37 @@ def parse_sysml(text: str) -> Model:
 # Safe expression evaluator
 # ----------------------------
 
-class SafeEvaluator(ast.NodeVisitor):
+# Compiled code objects per raw expression: the fixpoint loop below
+# re-evaluates unresolved expressions every pass, and parse+compile is
+# the expensive part; running the bytecode is a single eval() call
+_expr_cache: Dict[str, Any] = {}
+
+# Shared globals for compiled-expression eval; builtins stay empty
+_EVAL_GLOBALS: Dict[str, Any] = {"__builtins__": {}}
+
+
+class _DottedNameFolder(ast.NodeTransformer):
+    """
+    Fold Attribute chains (Part.attr, Root.Child.attr) into single Name
+    nodes whose id is the dotted path, so compiled code resolves each
+    reference with one env-dict lookup.
+    """
+
+    def visit_Attribute(self, node: ast.Attribute) -> ast.Name:
+        parts = []
+        cur = node
+        while isinstance(cur, ast.Attribute):
+            parts.append(cur.attr)
+            cur = cur.value
+        if not isinstance(cur, ast.Name):
+            raise ValueError(f"Disallowed expression node: {type(cur).__name__}")
+        parts.append(cur.id)
+        return ast.copy_location(
+            ast.Name(id=".".join(reversed(parts)), ctx=ast.Load()), node
+        )
+
+
+class SafeEvaluator:
     """
     Safe evaluator for simple arithmetic and attribute references.
     """
@@ -167,150 +226,140 @@ class SafeEvaluator(ast.NodeVisitor):
     def __init__(self, env: Dict[str, Union[int, float]]):
         self.env = env
 
-    def visit(self, node):
-        if not isinstance(node, self.allowed_nodes):
-            raise ValueError(f"Disallowed expression node: {type(node).__name__}")
-        return super().visit(node)
+    def _compile(self, expr: str):
+        tree = ast.parse(expr.replace("^", "**"), mode="eval")
+        for node in ast.walk(tree):
+            if not isinstance(node, self.allowed_nodes):
+                raise ValueError(f"Disallowed expression node: {type(node).__name__}")
+            if isinstance(node, ast.Constant) and not isinstance(node.value, (int, float)):
+                raise ValueError("Only numeric constants allowed")
+        tree = _DottedNameFolder().visit(tree)
+        ast.fix_missing_locations(tree)
+        return compile(tree, "<sysml>", "eval")
 
     def eval(self, expr: str) -> Union[int, float]:
-        expr = expr.replace("^", "**")
-        tree = ast.parse(expr, mode="eval")
-        return self.visit(tree.body)
-
-    def visit_Constant(self, node: ast.Constant):
-        if isinstance(node.value, (int, float)):
-            return node.value
-        raise ValueError("Only numeric constants allowed")
-
-    def visit_Name(self, node: ast.Name):
-        if node.id in self.env:
-            return self.env[node.id]
-        raise ValueError(f"Unknown variable: {node.id}")
-
-    def visit_Attribute(self, node: ast.Attribute):
-        parts = []
-        while isinstance(node, ast.Attribute):
-            parts.append(node.attr)
-            node = node.value
-        if isinstance(node, ast.Name):
-            parts.append(node.id)
-        full = ".".join(reversed(parts))
-        if full in self.env:
-            return self.env[full]
-        raise ValueError(f"Unknown attribute reference: {full}")
-
-    def visit_UnaryOp(self, node: ast.UnaryOp):
-        val = self.visit(node.operand)
-        if isinstance(node.op, ast.USub):
-            return -val
-        if isinstance(node.op, ast.UAdd):
-            return val
-        raise ValueError("Unsupported unary operator")
-
-    def visit_BinOp(self, node: ast.BinOp):
-        l = self.visit(node.left)
-        r = self.visit(node.right)
-        if isinstance(node.op, ast.Add):
-            return l + r
-        if isinstance(node.op, ast.Sub):
-            return l - r
-        if isinstance(node.op, ast.Mult):
-            return l * r
-        if isinstance(node.op, ast.Div):
-            return l / r
-        if isinstance(node.op, ast.Pow):
-            return l ** r
-        raise ValueError("Unsupported binary operator")
+        code = _expr_cache.get(expr)
+        if code is None:
+            code = _expr_cache[expr] = self._compile(expr)
+        try:
+            return eval(code, _EVAL_GLOBALS, self.env)
+        except NameError as e:
+            name = getattr(e, "name", None) or str(e)
+            if "." in name:
+                raise ValueError(f"Unknown attribute reference: {name}")
+            raise ValueError(f"Unknown variable: {name}")
 
 
 # ----------------------------
 # Semantic evaluation
 # ----------------------------
 
-def _collect_env(part: PartNode, parent_chain: Optional[List[str]] = None) -> Dict[str, float]:
-    """
-    Collect evaluated numeric attributes into a flat environment with multiple reference styles:
-    - unqualified: attrName
-    - child-qualified: PartName.attrName
-    - fully-qualified: Parent.Child.PartName.attrName
-    """
-    if parent_chain is None:
-        parent_chain = []
-
-    env: Dict[str, float] = {}
-
-    full_chain = parent_chain + [part.name]
-    full_prefix = ".".join(full_chain)   # e.g., "HabitationModule.O2Tank.O2Tank_dims"
-    local_prefix = part.name             # e.g., "O2Tank_dims"
-
-    for name, val in part.attributes_val.items():
-        if isinstance(val, (int, float)):
-            v = float(val)
-
-            # unqualified
-            env[name] = v
-
-            # part-local qualified
-            env[f"{local_prefix}.{name}"] = v
-
-            # fully-qualified along the chain
-            env[f"{full_prefix}.{name}"] = v
-
-    for child in part.children.values():
-        env.update(_collect_env(child, parent_chain=full_chain))
-
-    return env
+def _referenced_names(expr: str) -> tuple:
+    """Names (bare and dotted) an expression reads, for dependency ordering."""
+    tree = ast.parse(expr.replace("^", "**"), mode="eval")
+    tree = _DottedNameFolder().visit(tree)
+    return tuple({node.id for node in ast.walk(tree) if isinstance(node, ast.Name)})
 
 
 def evaluate_attributes(model: Model):
-    # Initialize literals
-    def init_literals(part: PartNode):
-        for name, raw in part.attributes_raw.items():
-            lit = _parse_literal_token(raw)
-            part.attributes_val[name] = lit
-        for child in part.children.values():
-            init_literals(child)
-
-    for p in model.parts.values():
-        init_literals(p)
-
-    # Iterative evaluation
-    for _ in range(10):
-        env: Dict[str, float] = {}
-        for p in model.parts.values():
-            env.update(_collect_env(p))
+    # One walk does it all: parse literals, publish already-numeric
+    # values into the env under every reference style (unqualified,
+    # part-qualified, fully-qualified), and queue the still-unresolved
+    # expressions with those same keys. The env is never rebuilt;
+    # resolve() inserts new values incrementally.
+    env: Dict[str, float] = {}
+    evaluator = SafeEvaluator(env)
+
+    pending: List[tuple] = []  # (part, attr, raw, env keys)
+    owner: Dict[str, int] = {}  # env key -> index of the pending producer
+
+    # Explicit-stack pre-order walk (children pushed reversed to keep
+    # recursion order, which decides which writer wins on shared keys)
+    stack = [(p, "") for p in reversed(list(model.parts.values()))]
+    while stack:
+        part, prefix = stack.pop()
+        full_prefix = prefix + part.name
+        raw_attrs = part.attributes_raw
+        # Building attributes_val in one comprehension sizes the dict
+        # on construction, avoiding the incremental resize cycles the
+        # default dict would go through as literals are inserted
+        part.attributes_val = {n: _parse_literal_token(r) for n, r in raw_attrs.items()}
+        for name, lit in part.attributes_val.items():
+            raw = raw_attrs[name]
+
+            keys = (name, f"{part.name}.{name}", f"{full_prefix}.{name}")
+            if isinstance(lit, (int, float)):
+                v = float(lit)
+                for k in keys:
+                    env[k] = v
+                continue
+            if raw.startswith('"') and raw.endswith('"'):
+                continue
 
+            idx = len(pending)
+            pending.append((part, name, raw, keys))
+            for k in keys:
+                owner[k] = idx
+        child_prefix = full_prefix + "."
+        for child in reversed(list(part.children.values())):
+            stack.append((child, child_prefix))
+
+    # Purely literal model: no expressions queued, nothing to order
+    if not pending:
+        return
+
+    def resolve(idx: int) -> bool:
+        part, name, raw, keys = pending[idx]
+        try:
+            val = evaluator.eval(raw)
+        except Exception:
+            return False
+        part.attributes_val[name] = val
+        v = float(val)
+        for k in keys:
+            env[k] = v
+        return True
+
+    # Kahn's algorithm over producer edges; expressions whose references
+    # are already in env (or unknowable) start ready
+    dependents: List[set] = [set() for _ in pending]
+    indegree = [0] * len(pending)
+    for i, (_, _, raw, _) in enumerate(pending):
+        try:
+            names = _referenced_names(raw)
+        except Exception:
+            names = ()
+        for nm in names:
+            j = owner.get(nm)
+            if j is not None and j != i and nm not in env and i not in dependents[j]:
+                dependents[j].add(i)
+                indegree[i] += 1
+
+    ready = [i for i, d in enumerate(indegree) if d == 0]
+    done = [False] * len(pending)
+    while ready:
+        i = ready.pop()
+        done[i] = True
+        resolve(i)
+        for j in dependents[i]:
+            indegree[j] -= 1
+            if indegree[j] == 0:
+                ready.append(j)
+
+    # Cyclic (or mutually blocked) leftovers: bounded fixpoint over just
+    # that subset, preserving the old iterative semantics
+    leftovers = [i for i, d in enumerate(done) if not d]
+    for _ in range(10):
+        if not leftovers:
+            break
         changed = False
-
-        def try_eval(part: PartNode):
-            nonlocal changed
-            evaluator = SafeEvaluator(env)
-
-            for name, raw in part.attributes_raw.items():
-                current_val = part.attributes_val.get(name)
-
-                # Skip if already numeric
-                if isinstance(current_val, (int, float)):
-                    continue
-
-                # Skip quoted string literals
-                if raw.startswith('"') and raw.endswith('"'):
-                    continue
-
-                # Try evaluating expression
-                try:
-                    val = evaluator.eval(raw)
-                    part.attributes_val[name] = val
-                    changed = True
-                except Exception:
-                    pass
-
-            for child in part.children.values():
-                try_eval(child)
-
-        for p in model.parts.values():
-            try_eval(p)
-
+        still = []
+        for i in leftovers:
+            if resolve(i):
+                changed = True
+            else:
+                still.append(i)
+        leftovers = still
         if not changed:
             break
 
@@ -319,26 +368,29 @@ def evaluate_attributes(model: Model):
 # Unit conversion
 # ----------------------------
 
+# Unit suffix -> (appended SI suffix, scale). One dict probe on the
+# tail after the last underscore replaces the endswith cascade.
+_SUFFIX_RULES: Dict[str, tuple] = {
+    "_volume": ("_m3", 0.001),             # liters -> m^3
+    "_usableO2Capacity": ("_m3", 0.001),   # liters -> m^3
+    "_operatingPressure": ("_Pa", 1000.0), # kPa -> Pa
+    "_maxPressure": ("_Pa", 1000.0),       # kPa -> Pa
+    "_dryMass": ("_kg", 1.0),              # kg stays kg
+    "_wallThickness": ("_m", 1.0),         # m stays m
+}
+
+
 def _convert_numeric_with_units(name: str, value: float) -> tuple[str, float]:
     """
     Apply SI conversion and return (new_name, new_value).
     Only known physical attributes get renamed; others pass through.
     """
-    if name.endswith("_volume"):
-        # liters -> m^3
-        return f"{name}_m3", value / 1000.0
-    if name.endswith("_usableO2Capacity"):
-        # liters -> m^3
-        return f"{name}_m3", value / 1000.0
-    if name.endswith("_operatingPressure") or name.endswith("_maxPressure"):
-        # kPa -> Pa
-        return f"{name}_Pa", value * 1000.0
-    if name.endswith("_dryMass"):
-        # kg stays kg
-        return f"{name}_kg", value
-    if name.endswith("_wallThickness"):
-        # m stays m
-        return f"{name}_m", value
+    idx = name.rfind("_")
+    if idx >= 0:
+        rule = _SUFFIX_RULES.get(name[idx:])
+        if rule is not None:
+            suffix, scale = rule
+            return f"{name}{suffix}", value * scale
 
     # Unknown unit / dimensionless: keep name as-is
     return name, value
@@ -357,10 +409,7 @@ def build_part_json(part: PartNode, namespace: str = "lunarspaceport1") -> Dict[
     metadata: Dict[str, Any] = {}
 
     # --- dimensions from nested "*dims" part (for THIS part only) ---
-    dims_part = next(
-        (c for n, c in part.children.items() if n.lower().endswith("dims")),
-        None
-    )
+    dims_part = part.dims_child
     if dims_part:
         dp = dims_part.attributes_val
 
@@ -369,7 +418,12 @@ def build_part_json(part: PartNode, namespace: str = "lunarspaceport1") -> Dict[
         ha = dp.get("height")
         mpu = dp.get("metersPerUnit", 1)
 
-        if all(isinstance(v, (int, float)) for v in [la, wa, ha, mpu]):
+        if (
+            isinstance(la, (int, float))
+            and isinstance(wa, (int, float))
+            and isinstance(ha, (int, float))
+            and isinstance(mpu, (int, float))
+        ):
             dimensions["dims_m"] = [la * mpu, wa * mpu, ha * mpu]
 
         for name, val in dp.items():
@@ -377,15 +431,13 @@ def build_part_json(part: PartNode, namespace: str = "lunarspaceport1") -> Dict[
                 continue
             dimensions[name] = val
 
-    # --- attributes: ALL numeric attributes of THIS part ---
+    # --- attributes (numeric) and metadata (non-numeric) of THIS part,
+    # split in a single pass over attrs ---
     for name, val in attrs.items():
         if isinstance(val, (int, float)):
             new_name, new_val = _convert_numeric_with_units(name, float(val))
             attributes[new_name] = new_val
-
-    # --- metadata: ALL non-numeric attributes of THIS part ---
-    for name, val in attrs.items():
-        if not isinstance(val, (int, float)):
+        else:
             metadata[name] = val
 
     return {
@@ -408,7 +460,12 @@ def sysml_to_json(sysml_text: str, namespace: str = "lunarspaceport1") -> List[D
 
     results: List[Dict[str, Any]] = []
 
-    def emit_part(part: PartNode, parent: Optional[PartNode] = None):
+    # Explicit-stack pre-order emit; (part, parent) tuples carry the
+    # parent link through the flattening
+    stack = [(p, None) for p in reversed(list(model.parts.values()))]
+    while stack:
+        part, parent = stack.pop()
+
         # Build base JSON for this part
         obj = build_part_json(part, namespace=namespace)
 
@@ -426,15 +483,11 @@ def sysml_to_json(sysml_text: str, namespace: str = "lunarspaceport1") -> List[D
 
         results.append(obj)
 
-        # Recurse into non-*dims children
-        for child_name, child in part.children.items():
+        # Descend into non-*dims children, reversed to keep emit order
+        for child_name, child in reversed(list(part.children.items())):
             if child_name.lower().endswith("dims"):
                 continue
-            emit_part(child, parent=part)
-
-    # Emit all top-level parts
-    for top_part in model.parts.values():
-        emit_part(top_part, parent=None)
+            stack.append((child, part))
 
     return results
 
@@ -458,7 +511,7 @@ def main():
     parts_json = sysml_to_json(sysml_text, namespace=namespace)
 
     with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(parts_json, f, indent=2)
+        f.write(_dumps(parts_json))
 
     print(f"Converted '{input_path}' → '{output_path}' using namespace '{namespace}'")
 
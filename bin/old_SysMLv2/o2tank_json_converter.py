@@ -1,395 +1,449 @@
-#!/usr/bin/env python3
-"""
-Future-proof SysML v2 → JSON converter.
-
-Output schema per top-level part:
-{
-  "type": "Part",
-  "id": "urn:<namespace>:part:<PartName>:001",
-  "name": "<PartName>",
-  "dimensions": { ... },
-  "attributes": { ... },
-  "metadata": { ... }
-}
-
-- Handles multiple top-level parts in a package
-- Parses parts + nested parts
-- Safely evaluates numeric expressions (no eval)
-- Converts units to SI (where known)
-- dimensions: derived from nested "*dims" parts
-- attributes: ALL numeric attributes (evaluated), with SI unit suffixes
-- metadata: ALL non-numeric attributes
-"""
-
-import json
-import re
-import sys
-import ast
-from dataclasses import dataclass, field
-from typing import Dict, Optional, Any, List, Union
-
-
-# ----------------------------
-# Data structures
-# ----------------------------
-
-@dataclass
-class PartNode:
-    name: str
-    attributes_raw: Dict[str, str] = field(default_factory=dict)
-    attributes_val: Dict[str, Any] = field(default_factory=dict)
-    children: Dict[str, "PartNode"] = field(default_factory=dict)
-
-
-@dataclass
-class Model:
-    package_name: Optional[str] = None
-    parts: Dict[str, PartNode] = field(default_factory=dict)
-
-
-# ----------------------------
-# Helpers
-# ----------------------------
-
-_str_re = re.compile(r'"([^"]*)"')
-_num_re = re.compile(r'^-?\d+(\.\d+)?$')
-
-
-def _strip_comment(line: str) -> str:
-    return line.split("//", 1)[0].rstrip()
-
-
-def _parse_literal_token(value_str: str) -> Any:
-    value_str = value_str.strip()
-
-    m = _str_re.fullmatch(value_str)
-    if m:
-        return m.group(1)
-
-    if _num_re.match(value_str):
-        return float(value_str) if "." in value_str else int(value_str)
-
-    return value_str
-
-
-# ----------------------------
-# SysML parser
-# ----------------------------
-
-def parse_sysml(text: str) -> Model:
-    model = Model()
-    current_stack: List[PartNode] = []
-    brace_stack: List[str] = []
-
-    for raw_line in text.splitlines():
-        line = _strip_comment(raw_line).strip()
-        if not line:
-            continue
-
-        # package
-        m = re.match(r"package\s+'([^']+)'\s*\{", line)
-        if m:
-            model.package_name = m.group(1)
-            brace_stack.append("package")
-            continue
-
-        # ignore requirement blocks
-        if re.match(r"requirement\s+\w+\s*\{", line):
-            brace_stack.append("ignore_req")
-            continue
-
-        # ignore satisfy statements
-        if re.match(r"satisfy\s+\w+\s+by\s+\w+;", line):
-            continue
-
-        # part (top-level or nested)
-        m = re.match(r"part\s+(\w+)\s*\{", line)
-        if m:
-            part_name = m.group(1)
-            node = PartNode(name=part_name)
-            if current_stack:
-                current_stack[-1].children[part_name] = node
-            else:
-                model.parts[part_name] = node
-            current_stack.append(node)
-            brace_stack.append("part")
-            continue
-
-        # closing brace
-        if line == "}":
-            if brace_stack:
-                ctx = brace_stack.pop()
-                if ctx == "part" and current_stack:
-                    current_stack.pop()
-            continue
-
-        # attributes
-        if current_stack:
-            m = re.match(r"attribute\s+(\w+)\s*=\s*(.+);", line)
-            if m:
-                attr_name = m.group(1)
-                raw_val = m.group(2).strip().rstrip(";")
-                current_stack[-1].attributes_raw[attr_name] = raw_val
-                continue
-
-    return model
-
-
-# ----------------------------
-# Safe expression evaluator
-# ----------------------------
-
-class SafeEvaluator(ast.NodeVisitor):
-    allowed_nodes = (
-        ast.Expression, ast.BinOp, ast.UnaryOp, ast.Load,
-        ast.Name, ast.Attribute, ast.Constant, ast.Pow,
-        ast.Add, ast.Sub, ast.Mult, ast.Div, ast.USub, ast.UAdd
-    )
-
-    def __init__(self, env: Dict[str, Union[int, float]]):
-        self.env = env
-
-    def visit(self, node):
-        if not isinstance(node, self.allowed_nodes):
-            raise ValueError(f"Disallowed expression node: {type(node).__name__}")
-        return super().visit(node)
-
-    def eval(self, expr: str) -> Union[int, float]:
-        expr = expr.replace("^", "**")
-        tree = ast.parse(expr, mode="eval")
-        return self.visit(tree.body)
-
-    def visit_Constant(self, node: ast.Constant):
-        if isinstance(node.value, (int, float)):
-            return node.value
-        raise ValueError("Only numeric constants allowed")
-
-    def visit_Name(self, node: ast.Name):
-        if node.id in self.env:
-            return self.env[node.id]
-        raise ValueError(f"Unknown variable: {node.id}")
-
-    def visit_Attribute(self, node: ast.Attribute):
-        parts = []
-        while isinstance(node, ast.Attribute):
-            parts.append(node.attr)
-            node = node.value
-        if isinstance(node, ast.Name):
-            parts.append(node.id)
-        full = ".".join(reversed(parts))
-        if full in self.env:
-            return self.env[full]
-        raise ValueError(f"Unknown attribute reference: {full}")
-
-    def visit_UnaryOp(self, node: ast.UnaryOp):
-        val = self.visit(node.operand)
-        if isinstance(node.op, ast.USub):
-            return -val
-        if isinstance(node.op, ast.UAdd):
-            return val
-        raise ValueError("Unsupported unary operator")
-
-    def visit_BinOp(self, node: ast.BinOp):
-        l = self.visit(node.left)
-        r = self.visit(node.right)
-        if isinstance(node.op, ast.Add):
-            return l + r
-        if isinstance(node.op, ast.Sub):
-            return l - r
-        if isinstance(node.op, ast.Mult):
-            return l * r
-        if isinstance(node.op, ast.Div):
-            return l / r
-        if isinstance(node.op, ast.Pow):
-            return l ** r
-        raise ValueError("Unsupported binary operator")
-
-
-
-
-def _collect_env(part: PartNode, parent_chain: List[str] | None = None) -> Dict[str, float]:
-    """
-    Collect evaluated numeric attributes into a flat environment with multiple reference styles:
-    - unqualified: attrName
-    - child-qualified: ChildPartName.attrName
-    - fully-qualified: Parent.ChildPartName.attrName (for nested parts)
-    """
-    if parent_chain is None:
-        parent_chain = []
-
-    env: Dict[str, float] = {}
-
-    # full chain including this part
-    full_chain = parent_chain + [part.name]
-    full_prefix = ".".join(full_chain)          # e.g. "O2Tank.O2Tank_dims"
-    local_prefix = part.name                    # e.g. "O2Tank_dims"
-
-    for name, val in part.attributes_val.items():
-        if isinstance(val, (int, float)):
-            v = float(val)
-
-            # unqualified
-            env[name] = v
-
-            # child-qualified (part-local)
-            env[f"{local_prefix}.{name}"] = v      # e.g. "O2Tank_dims.length"
-
-            # fully-qualified (full chain)
-            env[f"{full_prefix}.{name}"] = v       # e.g. "O2Tank.O2Tank_dims.length"
-
-    # recurse into children
-    for child in part.children.values():
-        env.update(_collect_env(child, parent_chain=full_chain))
-
-    return env
-
-
-def evaluate_attributes(model: Model):
-    # Initialize literals
-    def init_literals(part: PartNode):
-        for name, raw in part.attributes_raw.items():
-            lit = _parse_literal_token(raw)
-            part.attributes_val[name] = lit
-        for child in part.children.values():
-            init_literals(child)
-
-    for p in model.parts.values():
-        init_literals(p)
-
-    # Iterative evaluation
-    for _ in range(10):
-        env = {}
-        for p in model.parts.values():
-            env.update(_collect_env(p))
-
-        changed = False
-
-        def try_eval(part: PartNode):
-            nonlocal changed
-            evaluator = SafeEvaluator(env)
-
-            for name, raw in part.attributes_raw.items():
-                current_val = part.attributes_val.get(name)
-
-                # Skip if already numeric
-                if isinstance(current_val, (int, float)):
-                    continue
-
-                # Skip quoted string literals
-                if raw.startswith('"') and raw.endswith('"'):
-                    continue
-
-                # Try evaluating expression
-                try:
-                    val = evaluator.eval(raw)
-                    part.attributes_val[name] = val
-                    changed = True
-                except Exception:
-                    pass
-
-            for child in part.children.values():
-                try_eval(child)
-
-        for p in model.parts.values():
-            try_eval(p)
-
-        if not changed:
-            break
-
-
-
-
-def _convert_numeric_with_units(name: str, value: float) -> tuple[str, float]:
-    if name == "volume":
-        return "volume_m3", value / 1000.0
-    if name == "usableO2Capacity":
-        return "usableO2Capacity_m3", value / 1000.0
-    if name in ("maxPressure", "operatingPressure"):
-        return f"{name}_Pa", value * 1000.0
-    if name == "dryMass":
-        return "dryMass_kg", value
-    if name == "wallThickness":
-        return "wallThickness_m", value
-
-    return name, value
-
-
-
-
-def build_part_json(model: Model, part: PartNode, namespace: str = "lunarspaceport1") -> Dict[str, Any]:
-    part_id = f"urn:{namespace}:part:{part.name}:001"
-    attrs = part.attributes_val
-
-    dimensions = {}
-    attributes = {}
-    metadata = {}
-
-    # --- dimensions from nested "*dims" part ---
-    dims_part = next((c for n, c in part.children.items() if n.lower().endswith("dims")), None)
-    if dims_part:
-        dp = dims_part.attributes_val
-
-        la = dp.get("length")
-        wa = dp.get("width")
-        ha = dp.get("height")
-        mpu = dp.get("metersPerUnit", 1)
-
-        if all(isinstance(v, (int, float)) for v in [la, wa, ha, mpu]):
-            dimensions["dims_m"] = [la * mpu, wa * mpu, ha * mpu]
-
-        for name, val in dp.items():
-            if name not in ("length", "width", "height"):
-                dimensions[name] = val
-
-    # --- attributes: ALL numeric attributes ---
-    for name, val in attrs.items():
-        if isinstance(val, (int, float)):
-            new_name, new_val = _convert_numeric_with_units(name, float(val))
-            attributes[new_name] = new_val
-
-    # --- metadata: ALL non-numeric attributes ---
-    for name, val in attrs.items():
-        if not isinstance(val, (int, float)):
-            metadata[name] = val
-
-    return {
-        "type": "Part",
-        "id": part_id,
-        "name": part.name,
-        "dimensions": dimensions,
-        "attributes": attributes,
-        "metadata": metadata,
-    }
-
-
-def sysml_to_json(sysml_text: str, namespace: str = "lunarspaceport1") -> List[Dict[str, Any]]:
-    model = parse_sysml(sysml_text)
-    evaluate_attributes(model)
-    return [build_part_json(model, part, namespace=namespace) for part in model.parts.values()]
-
-
-def main():
-    if len(sys.argv) < 3:
-        print("Usage: python o2tank_json_converter.py <input.sysml> <output.json> [namespace]")
-        sys.exit(1)
-
-    input_path = sys.argv[1]
-    output_path = sys.argv[2]
-    namespace = sys.argv[3] if len(sys.argv) > 3 else "lunarspaceport1"
-
-    # Read SysML file
-    with open(input_path, "r", encoding="utf-8") as f:
-        sysml_text = f.read()
-
-    # Convert to JSON
-    parts_json = sysml_to_json(sysml_text, namespace=namespace)
-
-    # Write JSON file
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(parts_json, f, indent=2)
-
-    print(f"Converted '{input_path}' → '{output_path}' using namespace '{namespace}'")
-
-
-if __name__ == "__main__":
+#!/usr/bin/env python3
+"""
+Future-proof SysML v2 → JSON converter.
+
+Output schema per top-level part:
+{
+  "type": "Part",
+  "id": "urn:<namespace>:part:<PartName>:001",
+  "name": "<PartName>",
+  "dimensions": { ... },
+  "attributes": { ... },
+  "metadata": { ... }
+}
+
+- Handles multiple top-level parts in a package
+- Parses parts + nested parts
+- Safely evaluates numeric expressions (no eval)
+- Converts units to SI (where known)
+- dimensions: derived from nested "*dims" parts
+- attributes: ALL numeric attributes (evaluated), with SI unit suffixes
+- metadata: ALL non-numeric attributes
+"""
+
+import json
+import re
+import sys
+import ast
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Any, List, Union
+
+try:
+    # Serializes the output JSON in C; the fallback keeps the same
+    # 2-space indentation through the stdlib encoder
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    orjson = None
+
+    def _dumps(obj) -> str:
+        return json.dumps(obj, indent=2)
+
+
+# ----------------------------
+# Data structures
+# ----------------------------
+
+@dataclass
+class PartNode:
+    name: str
+    attributes_raw: Dict[str, str] = field(default_factory=dict)
+    attributes_val: Dict[str, Any] = field(default_factory=dict)
+    children: Dict[str, "PartNode"] = field(default_factory=dict)
+    # First child whose name ends with "dims", filled during parse so
+    # the JSON build doesn't rescan children per part
+    dims_child: Optional["PartNode"] = None
+
+
+@dataclass
+class Model:
+    package_name: Optional[str] = None
+    parts: Dict[str, PartNode] = field(default_factory=dict)
+
+
+# ----------------------------
+# Helpers
+# ----------------------------
+
+_str_re = re.compile(r'"([^"]*)"')
+_num_re = re.compile(r'^-?\d+(\.\d+)?$')
+
+# Lines are classified by str.startswith on the leading keyword and
+# picked apart with find/partition — all C-level string ops, no regex
+# engine startup per line. _str_re/_num_re stay for literal parsing.
+
+
+def _strip_comment(line: str) -> str:
+    # find() scans once; the common no-comment line takes only rstrip
+    i = line.find("//")
+    return line.rstrip() if i < 0 else line[:i].rstrip()
+
+
+def _parse_literal_token(value_str: str) -> Any:
+    value_str = value_str.strip()
+
+    m = _str_re.fullmatch(value_str)
+    if m:
+        return m.group(1)
+
+    if _num_re.match(value_str):
+        return float(value_str) if "." in value_str else int(value_str)
+
+    return value_str
+
+
+# ----------------------------
+# SysML parser
+# ----------------------------
+
+def parse_sysml(text: str) -> Model:
+    model = Model()
+    current_stack: List[PartNode] = []
+    brace_stack: List[str] = []
+
+    for raw_line in text.splitlines():
+        line = _strip_comment(raw_line).strip()
+        if not line:
+            continue
+
+        # package 'Name' {
+        if line.startswith("package "):
+            i = line.find("'")
+            j = line.find("'", i + 1)
+            if i != -1 and j != -1 and line[j + 1:].lstrip().startswith("{"):
+                model.package_name = line[i + 1:j]
+                brace_stack.append("package")
+                continue
+
+        # ignore requirement blocks
+        elif line.startswith("requirement "):
+            if "{" in line:
+                brace_stack.append("ignore_req")
+                continue
+
+        # ignore satisfy statements
+        elif line.startswith("satisfy "):
+            continue
+
+        # part (top-level or nested)
+        elif line.startswith("part "):
+            brace = line.find("{")
+            if brace != -1:
+                part_name = line[5:brace].strip()
+                if part_name.isidentifier():
+                    node = PartNode(name=part_name)
+                    if current_stack:
+                        parent = current_stack[-1]
+                        parent.children[part_name] = node
+                        if parent.dims_child is None and part_name.lower().endswith("dims"):
+                            parent.dims_child = node
+                    else:
+                        model.parts[part_name] = node
+                    current_stack.append(node)
+                    brace_stack.append("part")
+                    continue
+
+        # attribute name = value;
+        elif line.startswith("attribute ") and current_stack:
+            name_part, eq, raw_val = line[10:].partition("=")
+            attr_name = name_part.strip()
+            if eq and ";" in raw_val and attr_name.isidentifier():
+                current_stack[-1].attributes_raw[attr_name] = raw_val.strip().rstrip(";")
+                continue
+
+        # closing brace
+        if line == "}":
+            if brace_stack:
+                ctx = brace_stack.pop()
+                if ctx == "part" and current_stack:
+                    current_stack.pop()
+            continue
+
+    return model
+
+
+# ----------------------------
+# Safe expression evaluator
+# ----------------------------
+
+# Compiled code objects per raw expression: the fixpoint loop below
+# re-evaluates unresolved expressions every pass, and parse+compile is
+# the expensive part; running the bytecode is a single eval() call
+_expr_cache: Dict[str, Any] = {}
+
+# Shared globals for compiled-expression eval; builtins stay empty
+_EVAL_GLOBALS: Dict[str, Any] = {"__builtins__": {}}
+
+
+class _DottedNameFolder(ast.NodeTransformer):
+    """
+    Fold Attribute chains (Part.attr, Root.Child.attr) into single Name
+    nodes whose id is the dotted path, so compiled code resolves each
+    reference with one env-dict lookup.
+    """
+
+    def visit_Attribute(self, node: ast.Attribute) -> ast.Name:
+        parts = []
+        cur = node
+        while isinstance(cur, ast.Attribute):
+            parts.append(cur.attr)
+            cur = cur.value
+        if not isinstance(cur, ast.Name):
+            raise ValueError(f"Disallowed expression node: {type(cur).__name__}")
+        parts.append(cur.id)
+        return ast.copy_location(
+            ast.Name(id=".".join(reversed(parts)), ctx=ast.Load()), node
+        )
+
+
+class SafeEvaluator:
+    allowed_nodes = (
+        ast.Expression, ast.BinOp, ast.UnaryOp, ast.Load,
+        ast.Name, ast.Attribute, ast.Constant, ast.Pow,
+        ast.Add, ast.Sub, ast.Mult, ast.Div, ast.USub, ast.UAdd
+    )
+
+    def __init__(self, env: Dict[str, Union[int, float]]):
+        self.env = env
+
+    def _compile(self, expr: str):
+        tree = ast.parse(expr.replace("^", "**"), mode="eval")
+        for node in ast.walk(tree):
+            if not isinstance(node, self.allowed_nodes):
+                raise ValueError(f"Disallowed expression node: {type(node).__name__}")
+            if isinstance(node, ast.Constant) and not isinstance(node.value, (int, float)):
+                raise ValueError("Only numeric constants allowed")
+        tree = _DottedNameFolder().visit(tree)
+        ast.fix_missing_locations(tree)
+        return compile(tree, "<sysml>", "eval")
+
+    def eval(self, expr: str) -> Union[int, float]:
+        code = _expr_cache.get(expr)
+        if code is None:
+            code = _expr_cache[expr] = self._compile(expr)
+        try:
+            return eval(code, _EVAL_GLOBALS, self.env)
+        except NameError as e:
+            name = getattr(e, "name", None) or str(e)
+            if "." in name:
+                raise ValueError(f"Unknown attribute reference: {name}")
+            raise ValueError(f"Unknown variable: {name}")
+
+
+
+
+def _referenced_names(expr: str) -> tuple:
+    """Names (bare and dotted) an expression reads, for dependency ordering."""
+    tree = ast.parse(expr.replace("^", "**"), mode="eval")
+    tree = _DottedNameFolder().visit(tree)
+    return tuple({node.id for node in ast.walk(tree) if isinstance(node, ast.Name)})
+
+
+def evaluate_attributes(model: Model):
+    # One walk does it all: parse literals, publish already-numeric
+    # values into the env under every reference style (unqualified,
+    # part-qualified, fully-qualified), and queue the still-unresolved
+    # expressions with those same keys. The env is never rebuilt;
+    # resolve() inserts new values incrementally.
+    env: Dict[str, float] = {}
+    evaluator = SafeEvaluator(env)
+
+    pending: List[tuple] = []  # (part, attr, raw, env keys)
+    owner: Dict[str, int] = {}  # env key -> index of the pending producer
+
+    # Explicit-stack pre-order walk (children pushed reversed to keep
+    # recursion order, which decides which writer wins on shared keys)
+    stack = [(p, "") for p in reversed(list(model.parts.values()))]
+    while stack:
+        part, prefix = stack.pop()
+        full_prefix = prefix + part.name
+        raw_attrs = part.attributes_raw
+        # The comprehension sizes attributes_val correctly at
+        # construction instead of growing the default dict insert by
+        # insert through CPython's resize thresholds
+        part.attributes_val = {n: _parse_literal_token(r) for n, r in raw_attrs.items()}
+        for name, lit in part.attributes_val.items():
+            raw = raw_attrs[name]
+
+            keys = (name, f"{part.name}.{name}", f"{full_prefix}.{name}")
+            if isinstance(lit, (int, float)):
+                v = float(lit)
+                for k in keys:
+                    env[k] = v
+                continue
+            if raw.startswith('"') and raw.endswith('"'):
+                continue
+
+            idx = len(pending)
+            pending.append((part, name, raw, keys))
+            for k in keys:
+                owner[k] = idx
+        child_prefix = full_prefix + "."
+        for child in reversed(list(part.children.values())):
+            stack.append((child, child_prefix))
+
+    # All-literal model: nothing to evaluate, skip the ordering setup
+    if not pending:
+        return
+
+    def resolve(idx: int) -> bool:
+        part, name, raw, keys = pending[idx]
+        try:
+            val = evaluator.eval(raw)
+        except Exception:
+            return False
+        part.attributes_val[name] = val
+        v = float(val)
+        for k in keys:
+            env[k] = v
+        return True
+
+    # Kahn's algorithm over producer edges; expressions whose references
+    # are already in env (or unknowable) start ready
+    dependents: List[set] = [set() for _ in pending]
+    indegree = [0] * len(pending)
+    for i, (_, _, raw, _) in enumerate(pending):
+        try:
+            names = _referenced_names(raw)
+        except Exception:
+            names = ()
+        for nm in names:
+            j = owner.get(nm)
+            if j is not None and j != i and nm not in env and i not in dependents[j]:
+                dependents[j].add(i)
+                indegree[i] += 1
+
+    ready = [i for i, d in enumerate(indegree) if d == 0]
+    done = [False] * len(pending)
+    while ready:
+        i = ready.pop()
+        done[i] = True
+        resolve(i)
+        for j in dependents[i]:
+            indegree[j] -= 1
+            if indegree[j] == 0:
+                ready.append(j)
+
+    # Cyclic (or mutually blocked) leftovers: bounded fixpoint over just
+    # that subset, preserving the old iterative semantics
+    leftovers = [i for i, d in enumerate(done) if not d]
+    for _ in range(10):
+        if not leftovers:
+            break
+        changed = False
+        still = []
+        for i in leftovers:
+            if resolve(i):
+                changed = True
+            else:
+                still.append(i)
+        leftovers = still
+        if not changed:
+            break
+
+
+
+
+# name -> (converted name, scale factor): one hash lookup replaces the
+# chain of string comparisons, and the multiplies fold the old divides
+_UNIT_TABLE: Dict[str, tuple] = {
+    "volume": ("volume_m3", 0.001),                        # liters -> m^3
+    "usableO2Capacity": ("usableO2Capacity_m3", 0.001),    # liters -> m^3
+    "maxPressure": ("maxPressure_Pa", 1000.0),             # kPa -> Pa
+    "operatingPressure": ("operatingPressure_Pa", 1000.0), # kPa -> Pa
+    "dryMass": ("dryMass_kg", 1.0),                        # kg stays kg
+    "wallThickness": ("wallThickness_m", 1.0),             # m stays m
+}
+
+
+def _convert_numeric_with_units(name: str, value: float) -> tuple[str, float]:
+    rule = _UNIT_TABLE.get(name)
+    if rule is None:
+        return name, value
+    new_name, scale = rule
+    return new_name, value * scale
+
+
+
+
+def build_part_json(model: Model, part: PartNode, namespace: str = "lunarspaceport1") -> Dict[str, Any]:
+    part_id = f"urn:{namespace}:part:{part.name}:001"
+    attrs = part.attributes_val
+
+    dimensions = {}
+    attributes = {}
+    metadata = {}
+
+    # --- dimensions from nested "*dims" part ---
+    dims_part = part.dims_child
+    if dims_part:
+        dp = dims_part.attributes_val
+
+        la = dp.get("length")
+        wa = dp.get("width")
+        ha = dp.get("height")
+        mpu = dp.get("metersPerUnit", 1)
+
+        if (
+            isinstance(la, (int, float))
+            and isinstance(wa, (int, float))
+            and isinstance(ha, (int, float))
+            and isinstance(mpu, (int, float))
+        ):
+            dimensions["dims_m"] = [la * mpu, wa * mpu, ha * mpu]
+
+        for name, val in dp.items():
+            if name not in ("length", "width", "height"):
+                dimensions[name] = val
+
+    # --- attributes (numeric) and metadata (non-numeric) in one pass ---
+    for name, val in attrs.items():
+        if isinstance(val, (int, float)):
+            new_name, new_val = _convert_numeric_with_units(name, float(val))
+            attributes[new_name] = new_val
+        else:
+            metadata[name] = val
+
+    return {
+        "type": "Part",
+        "id": part_id,
+        "name": part.name,
+        "dimensions": dimensions,
+        "attributes": attributes,
+        "metadata": metadata,
+    }
+
+
+def sysml_to_json(sysml_text: str, namespace: str = "lunarspaceport1") -> List[Dict[str, Any]]:
+    model = parse_sysml(sysml_text)
+    evaluate_attributes(model)
+    return [build_part_json(model, part, namespace=namespace) for part in model.parts.values()]
+
+
+def main():
+    if len(sys.argv) < 3:
+        print("Usage: python o2tank_json_converter.py <input.sysml> <output.json> [namespace]")
+        sys.exit(1)
+
+    input_path = sys.argv[1]
+    output_path = sys.argv[2]
+    namespace = sys.argv[3] if len(sys.argv) > 3 else "lunarspaceport1"
+
+    # Read SysML file
+    with open(input_path, "r", encoding="utf-8") as f:
+        sysml_text = f.read()
+
+    # Convert to JSON
+    parts_json = sysml_to_json(sysml_text, namespace=namespace)
+
+    # Write JSON file
+    with open(output_path, "w", encoding="utf-8") as f:
+        f.write(_dumps(parts_json))
+
+    print(f"Converted '{input_path}' → '{output_path}' using namespace '{namespace}'")
+
+
+if __name__ == "__main__":
     main()
\ No newline at end of file
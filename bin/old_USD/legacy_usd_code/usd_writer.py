@@ -1,38 +1,67 @@
-from pxr import Usd, UsdGeom, Sdf
- 
+from pxr import Usd, UsdGeom, Sdf, Gf
+
 def write_usd(model, output_path="output.usd"):
     # Create a new USD stage
     stage = Usd.Stage.CreateNew(output_path)
- 
-    # Write each top-level part as a USD prim
-    for part in model["parts"]:
-        write_part(stage, part, parent_path="/")
- 
+    layer = stage.GetRootLayer()
+
+    # One notification batch for the whole write: the ChangeBlock defers
+    # change processing until every prim and attribute is authored
+    with Sdf.ChangeBlock():
+        for part in model["parts"]:
+            write_part(layer, part, parent_path="/")
+
     # Save the USD file
-    stage.GetRootLayer().Save()
+    layer.Save()
     return output_path
- 
- 
-def write_part(stage, part, parent_path):
+
+
+def _author_attribute(prim_spec, key, value):
+    # Typed authoring: numbers stay binary doubles/ints in the crate
+    # file instead of stringified ASCII consumers would have to reparse
+    if isinstance(value, bool):
+        attr = Sdf.AttributeSpec(prim_spec, key, Sdf.ValueTypeNames.Bool)
+        attr.default = value
+    elif isinstance(value, float):
+        attr = Sdf.AttributeSpec(prim_spec, key, Sdf.ValueTypeNames.Double)
+        attr.default = value
+    elif isinstance(value, int):
+        attr = Sdf.AttributeSpec(prim_spec, key, Sdf.ValueTypeNames.Int)
+        attr.default = value
+    elif (
+        isinstance(value, (list, tuple))
+        and len(value) == 3
+        and all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in value)
+    ):
+        # dims_m and friends: three numbers become a vector
+        attr = Sdf.AttributeSpec(prim_spec, key, Sdf.ValueTypeNames.Double3)
+        attr.default = Gf.Vec3d(*value)
+    else:
+        attr = Sdf.AttributeSpec(prim_spec, key, Sdf.ValueTypeNames.String)
+        attr.default = str(value)
+
+
+def write_part(layer, part, parent_path):
     name = part["name"]
     prim_path = parent_path + name
- 
-    # Create an Xform prim for the part
-    prim = UsdGeom.Xform.Define(stage, prim_path)
- 
+
+    # Author directly on the root layer: Sdf specs bypass the Usd-level
+    # composition engine and its per-call notification fanout
+    prim_spec = Sdf.CreatePrimInLayer(layer, prim_path)
+    prim_spec.specifier = Sdf.SpecifierDef
+    prim_spec.typeName = "Xform"
+
     # Write attributes (flat key/value)
     for key, value in part["attributes"].items():
-        attr = prim.GetPrim().CreateAttribute(key, Sdf.ValueTypeNames.String)
-        attr.Set(str(value))
- 
+        _author_attribute(prim_spec, key, value)
+
     # Write children (nested parts or attribute groups)
     for child in part["children"]:
         # If it's a nested part
         if child["kind"] == "part":
-            write_part(stage, child, prim_path + "/")
- 
+            write_part(layer, child, prim_path + "/")
+
         # If it's an attribute group, flatten it
         elif child["kind"] == "attribute_group":
             for key, value in child["attributes"].items():
-                attr = prim.GetPrim().CreateAttribute(f"{child['name']}:{key}", Sdf.ValueTypeNames.String)
-                attr.Set(str(value))
\ No newline at end of file
+                _author_attribute(prim_spec, f"{child['name']}:{key}", value)
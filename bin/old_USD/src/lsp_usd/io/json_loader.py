@@ -2,9 +2,38 @@
 
 from __future__ import annotations
 
+import mmap
 import os, json
 from typing import Any, Dict, Union, List
 
+try:
+    # Buffer-accepting C parser: lets the file branch parse straight
+    # out of an mmap'd view with no duplicate bytes buffer
+    import orjson
+except ImportError:
+    orjson = None
+
+_loads = json.loads if orjson is None else orjson.loads
+
+try:
+    # Streaming parser: yields one part dict at a time instead of
+    # building the whole document tree, cutting peak memory on large
+    # parts files. Optional; json.load covers its absence.
+    import ijson
+except ImportError:
+    ijson = None
+
+
+class JsonVettingError(ValueError):
+    pass
+
+
+def _stream_items(f, prefix: str):
+    for item in ijson.items(f, prefix):
+        if not isinstance(item, dict):
+            raise JsonVettingError("Top-level list must contain only objects/dicts.")
+        yield item
+
 
 def load_parts_json(source: Union[str, List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
     """
@@ -23,17 +52,42 @@ def load_parts_json(source: Union[str, List[Dict[str, Any]]]) -> List[Dict[str,
 
     s = source.strip()
 
-    # If it's a path to an existing file
-    if os.path.exists(s) and os.path.isfile(s):
-        with open(s, "r", encoding="utf-8") as f:
-            data = json.load(f)
+    # JSON text is decided from the first character, before any
+    # filesystem probe: a large inline payload must never be handed to
+    # a stat call as a path. Path candidates are gated on PATH_MAX.
+    if s[:1] in ("[", "{"):
+        data = _loads(s)
+    elif len(s) < 4096 and os.path.isfile(s):
+        if ijson is not None:
+            with open(s, "rb") as f:
+                # First non-whitespace byte picks the stream prefix: a
+                # top-level object means the parts live under "parts"
+                head = f.read(1)
+                while head.isspace():
+                    head = f.read(1)
+                f.seek(0)
+                data = list(_stream_items(f, "parts.item" if head == b"{" else "item"))
+            if not data:
+                raise JsonVettingError(
+                    "Top-level JSON must be a non-empty list of parts (or dict with key 'parts')."
+                )
+            return data
+        if orjson is not None:
+            # Page-cache-backed parse: the OS maps the file and orjson
+            # reads the view directly; Python never owns a second copy
+            with open(s, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                mv = memoryview(mm)
+                try:
+                    data = orjson.loads(mv)
+                finally:
+                    mv.release()
+        else:
+            with open(s, "rb") as f:
+                data = json.loads(f.read())
     else:
-        # Otherwise treat as JSON text
-        if not (s.startswith("[") or s.startswith("{")):
-            raise JsonVettingError(
-                "JSON source is a string but is neither a valid file path nor JSON text."
-            )
-        data = json.loads(s)
+        raise JsonVettingError(
+            "JSON source is a string but is neither a valid file path nor JSON text."
+        )
 
     # Normalize top-level: if dict with "parts", use it; else require list
     if isinstance(data, dict) and "parts" in data:
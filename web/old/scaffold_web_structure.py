@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 
 # Root folder of your project (script should live in repo root)
@@ -33,12 +34,18 @@ STRUCTURE = {
 }
 
 
-def create_file(path: Path):
-    if path.exists():
-        print(f"⏭  Skipped (exists): {path}")
-    else:
-        path.touch()
-        print(f"✅ Created file: {path}")
+def create_files(folder_path: Path, filenames):
+    # One scandir per directory replaces an exists() stat per file;
+    # open(..., 'a') creates without the extra utime Path.touch() pays
+    existing = {entry.name for entry in os.scandir(folder_path)}
+    for filename in filenames:
+        path = folder_path / filename
+        if filename in existing:
+            print(f"⏭  Skipped (exists): {path}")
+        else:
+            with open(path, "a"):
+                pass
+            print(f"✅ Created file: {path}")
 
 
 def main():
@@ -48,20 +55,17 @@ def main():
     WEB_DIR.mkdir(exist_ok=True)
     print(f"📁 Ensured directory: {WEB_DIR}")
 
-    for key, value in STRUCTURE.items():
+    # Case 1: Root-level files (like index.html)
+    create_files(WEB_DIR, [key for key, value in STRUCTURE.items() if value is None])
 
-        # Case 1: Root-level file (like index.html)
+    # Case 2: Folders with files
+    for key, value in STRUCTURE.items():
         if value is None:
-            create_file(WEB_DIR / key)
-
-        # Case 2: Folder with files
-        else:
-            folder_path = WEB_DIR / key
-            folder_path.mkdir(exist_ok=True)
-            print(f"📁 Ensured directory: {folder_path}")
-
-            for filename in value:
-                create_file(folder_path / filename)
+            continue
+        folder_path = WEB_DIR / key
+        folder_path.mkdir(exist_ok=True)
+        print(f"📁 Ensured directory: {folder_path}")
+        create_files(folder_path, value)
 
     print("\n✨ Done.\n")
 